@@ -227,6 +227,7 @@ class IntervalSet(Generic[TO], AbstractSet[Interval[TO]], metaclass=ABCMeta):
     def select(
         self, value: IntervalValue[TO], strict: bool = True
     ) -> Iterator[Interval[TO]]: ...
+    def gaps(self, value: IntervalValue[TO]) -> Iterator[Interval[TO]]: ...
 
 class FrozenIntervalSet(Generic[TO], IntervalSet[TO]):
     def __init__(
@@ -275,6 +276,11 @@ class IntervalDict(Generic[TO, V], Mapping[Interval[TO], V], metaclass=ABCMeta):
     def select(
         self, value: IntervalValue[TO], strict: bool = True
     ) -> Iterator[Interval[TO]]: ...
+    def gaps(self, value: IntervalValue[TO]) -> Iterator[Interval[TO]]: ...
+    def as_canonical(
+        self,
+    ) -> Tuple[Tuple[TO, TO, Optional[bool], Optional[bool], V], ...]: ...
+    def compress(self) -> IntervalDict[TO, V]: ...
 
 class FrozenIntervalDict(Generic[TO, V], IntervalDict[TO, V]):
     def __init__(
@@ -311,3 +317,6 @@ class MutableIntervalDict(
             Iterable[Tuple[IntervalValue[TO], V]],
         ],
     ) -> None: ...
+    def clear(self) -> None: ...
+    def copy(self) -> MutableIntervalDict[TO, V]: ...
+    def compress_inplace(self) -> MutableIntervalDict[TO, V]: ...
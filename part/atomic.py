@@ -4,6 +4,7 @@
 
 from abc import ABC, abstractmethod
 from collections import namedtuple
+from functools import lru_cache
 from typing import Union, Tuple, Any, Optional, Generic, TypeVar
 
 import part
@@ -237,23 +238,39 @@ class Atomic(Generic[TO], ABC):
             (10;20)
             >>> print(Atomic[int].from_tuple((10, 20, None, True)))
             (10;20]
+
+        Note
+        ----
+            Intervals created from tuples of :class:`int` or :class:`str` bounds are
+            cached and shared between calls: they must never be modified.
         """
+        # Only exact int and str bounds (and bool or None flags) are cached: equal
+        # values of other types (Decimal('1') and Decimal('1.00'), datetimes in
+        # different timezones, ...) can still be told apart
+        if all(type(value) in _CACHED_TYPES for value in item):
+            return _from_tuple(*item)
+        return Atomic._from_tuple(item)
+
+    @staticmethod
+    def _from_tuple(item: IntervalTuple[TO]):
+        # Interval is called directly: calling the Interval[TO] alias costs as much
+        # as building the interval itself
         if len(item) == 1:
-            return Interval[TO](
+            return Interval(
                 lower_value=item[0],  # type: ignore
                 upper_value=item[0],  # type: ignore
                 upper_closed=True,
             )
         if len(item) == 2:
-            return Interval[TO](lower_value=item[0], upper_value=item[1])
+            return Interval(lower_value=item[0], upper_value=item[1])
         if len(item) == 3:
-            return Interval[TO](
+            return Interval(
                 lower_value=item[0],
                 upper_value=item[1],
                 lower_closed=bool(item[2]) or None,  # type: ignore
             )
         if len(item) == 4:
-            return Interval[TO](
+            return Interval(
                 lower_value=item[0],
                 upper_value=item[1],
                 lower_closed=bool(item[2]) or None,  # type: ignore
@@ -283,6 +300,9 @@ class Atomic(Generic[TO], ABC):
             >>> print(Atomic[int].from_value(10))
             [10;10]
         """
+        convert = _FROM_VALUE.get(value.__class__)
+        if convert is not None:
+            return convert(value)
         if isinstance(value, Empty):
             return value
         if isinstance(value, Interval):
@@ -442,6 +462,14 @@ class Atomic(Generic[TO], ABC):
         raise NotImplementedError
 
 
+_CACHED_TYPES = (int, str, bool, type(None))
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _from_tuple(*item):
+    return Atomic._from_tuple(item)  # pylint: disable=protected-access
+
+
 class Empty(Generic[TO], Singleton, Atomic[TO]):
     """
     Empty set class.
@@ -580,6 +608,8 @@ class Mark(namedtuple("Mark", ["value", "type"])):
       - 1 for an open lower mark
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         """Return str(self)."""
         return (
@@ -630,7 +660,7 @@ class Interval(Generic[TO], Atomic[TO]):
     Each bound of the interval can be open or closed.
     """
 
-    __slots__ = ("_lower", "_upper")
+    __slots__ = ("_lower", "_upper", "_hash")
 
     # pylint: disable=arguments-differ
     def __new__(  # type: ignore
@@ -752,6 +782,16 @@ class Interval(Generic[TO], Atomic[TO]):
         self._lower = Mark(value=lower_value, type=0 if lower_closed else 1)
         self._upper = Mark(value=upper_value, type=0 if upper_closed else -1)
 
+    @staticmethod
+    def _from_marks(lower: Mark, upper: Mark) -> "Interval":
+        # Build the interval between two marks without going through __new__ and
+        # __init__: the marks are trusted to define a non-empty interval.
+        # pylint: disable=protected-access
+        interval = object.__new__(Interval)
+        interval._lower = lower
+        interval._upper = upper
+        return interval
+
     def __str__(self) -> str:
         """Return str(self)."""
         return (
@@ -762,11 +802,11 @@ class Interval(Generic[TO], Atomic[TO]):
 
     def __eq__(self, other) -> bool:
         """Return self==other."""
+        if isinstance(other, Interval):
+            return self._lower == other._lower and self._upper == other._upper
         if super().__eq__(other) is NotImplemented:
             return NotImplemented
-        if not other:
-            return False
-        return self._lower == other.lower and self._upper == other.upper
+        return False
 
     def __lt__(self, other) -> bool:
         """
@@ -792,11 +832,11 @@ class Interval(Generic[TO], Atomic[TO]):
             >>> a < Atomic[int].from_tuple((25, 30))
             True
         """
+        if isinstance(other, Interval):
+            return self._upper < other._lower
         if super().__eq__(other) is NotImplemented:
             return NotImplemented
-        if not other:
-            return False
-        return self._upper < other.lower
+        return False
 
     def __gt__(self, other) -> bool:
         """
@@ -822,15 +862,30 @@ class Interval(Generic[TO], Atomic[TO]):
             >>> a > Atomic[int].from_tuple((25, 30))
             False
         """
+        if isinstance(other, Interval):
+            return self._lower > other._upper
         if super().__eq__(other) is NotImplemented:
             return NotImplemented
-        if not other:
-            return False
-        return self._lower > other.upper
+        return False
 
     def __hash__(self) -> int:
         """Return hash(self)."""
-        return hash((self._lower, self._upper))
+        # Intervals are immutable and hashed at each dictionary lookup, the hash is
+        # computed at first use only
+        try:
+            return self._hash  # type: ignore
+        except AttributeError:
+            # pylint: disable=attribute-defined-outside-init
+            self._hash = hash((self._lower, self._upper))
+            return self._hash
+
+    def __getstate__(self):
+        """Return the state of self without the cached hash."""
+        return self._lower, self._upper
+
+    def __setstate__(self, state) -> None:
+        """Restore the state of self."""
+        self._lower, self._upper = state
 
     def __bool__(self) -> bool:
         """
@@ -899,14 +954,18 @@ class Interval(Generic[TO], Atomic[TO]):
         """
         if not isinstance(other, Atomic):
             return super().__and__(other)
-        if not other:
-            return part.FrozenIntervalSet[part.TO]()
-        if self > other or self < other:
-            return part.FrozenIntervalSet[part.TO]()
-        result = Interval[TO]()
-        result._lower = max(self._lower, other.lower)  # type: ignore
-        result._upper = min(self._upper, other.upper)  # type: ignore
-        return part.FrozenIntervalSet[TO]([result])  # type: ignore
+        # The intersection is appended as is to a new set: it does not need to be
+        # sorted nor merged
+        # pylint: disable=protected-access
+        result: "part.FrozenIntervalSet[part.TO]" = part.FrozenIntervalSet()
+        if other and not (self > other or self < other):
+            result._append(  # type: ignore
+                Interval._from_marks(
+                    max(self._lower, other.lower),  # type: ignore
+                    min(self._upper, other.upper),  # type: ignore
+                )
+            )
+        return result
 
     def __sub__(self, other) -> "part.FrozenIntervalSet[part.TO]":
         """
@@ -933,14 +992,25 @@ class Interval(Generic[TO], Atomic[TO]):
             (10;15)
             >>> print(a - c)
             (10;20)
+            >>> print(b - a)
+            [20;30)
+            >>> print(a - Atomic[int].from_tuple((12, 15)))
+            (10;12) | [15;20)
         """
         if not isinstance(other, Atomic):
             return super().__sub__(other)
-        return part.FrozenIntervalSet[part.TO](  # type: ignore
-            [self]  # type: ignore
-        ) - part.FrozenIntervalSet[part.TO](
-            [other]  # type: ignore
-        )
+        if not other or self < other or self > other:
+            return part.FrozenIntervalSet[TO]([self])  # type: ignore
+        # The difference is made of the parts of self before and after other
+        # pylint: disable=protected-access
+        result: "part.FrozenIntervalSet[part.TO]" = part.FrozenIntervalSet()
+        upper = other.lower.prev()  # type: ignore
+        if self._lower <= upper:
+            result._append(Interval._from_marks(self._lower, upper))  # type: ignore
+        lower = other.upper.next()  # type: ignore
+        if lower <= self._upper:
+            result._append(Interval._from_marks(lower, self._upper))  # type: ignore
+        return result
 
     def __xor__(self, other) -> "part.FrozenIntervalSet[part.TO]":
         """
@@ -1415,4 +1485,18 @@ class Interval(Generic[TO], Atomic[TO]):
         return self._upper.type == 0 or None
 
 
+def _from_scalar(value):
+    return Atomic.from_tuple((value, value, True, True))
+
+
+# Exact type dispatch used by Atomic.from_value before the isinstance chain
+_FROM_VALUE = {
+    Empty: lambda value: value,
+    Interval: lambda value: value,
+    tuple: Atomic.from_tuple,
+    int: _from_scalar,
+    float: _from_scalar,
+    str: _from_scalar,
+}
+
 IntervalValue = Union[TO, Interval[TO], IntervalTuple[TO]]
@@ -4,9 +4,11 @@
 
 import bisect
 import collections.abc
+import heapq
 import itertools
 from abc import ABCMeta, abstractmethod
 from functools import reduce
+from operator import attrgetter
 from typing import (
     Union,
     Mapping,
@@ -22,13 +24,16 @@ from typing import (
 )
 
 # pylint: disable=import-error
-from sortedcontainers import SortedSet, SortedList  # type: ignore
+from sortedcontainers import SortedKeyList  # type: ignore
 
-from part import atomic, sets
+from part import atomic
+from part.sets import _gaps, _select
 
 # pylint: disable=invalid-name
 V = TypeVar("V")
 
+_UPPER = attrgetter("_upper")
+
 
 # pylint: disable=too-many-ancestors
 class IntervalDict(
@@ -102,6 +107,28 @@ class IntervalDict(
             }
         )
 
+    def __eq__(self, other) -> bool:
+        """
+        Return self==other.
+
+        Two interval dictionaries are equal when they hold the same sorted intervals
+        and map them to the same values. Their inner containers are compared
+        directly, which avoids building intermediate item views.
+
+        Examples
+        --------
+
+            >>> from part import FrozenIntervalDict, MutableIntervalDict
+            >>> a = FrozenIntervalDict[int, int]({(10, 15): 1, (20, 25): 2})
+            >>> a == MutableIntervalDict[int, int]({(20, 25): 2, (10, 15): 1})
+            True
+            >>> a == MutableIntervalDict[int, int]({(10, 15): 1})
+            False
+        """
+        if isinstance(other, IntervalDict):
+            return list(self) == list(other) and self._mapping == other._mapping
+        return super().__eq__(other)
+
     def __len__(self) -> int:
         """
         Return the number of inner intervals.
@@ -219,18 +246,18 @@ class IntervalDict(
         """
         if isinstance(key, slice):
             search = IntervalDict._from_slice(key)
-            intervals = self._intervals.__class__()  # type: ignore
+            intervals = []
             mapping = {}
             for found in self.select(search, strict=False):
                 value = self._mapping[found]
-                interval = atomic.Interval()  # type: ignore
-                interval._lower = max(found.lower, search.lower)
-                interval._upper = min(found.upper, search.upper)
+                interval = atomic.Interval._from_marks(
+                    max(found.lower, search.lower), min(found.upper, search.upper)
+                )
                 intervals.append(interval)
                 mapping[interval] = value
             # pylint: disable=too-many-function-args
             result = self.__class__()
-            result._intervals = intervals
+            result._update_intervals(intervals)
             result._mapping = mapping
             return result  # type: ignore
         interval = IntervalDict._interval(key)
@@ -238,7 +265,7 @@ class IntervalDict(
         if index < len(self._intervals):  # type: ignore
             other = self._intervals[index]  # type: ignore
             if interval.during(other, strict=False):
-                return self._mapping[self._intervals[index]]  # type: ignore
+                return self._mapping[other]
         raise KeyError(str(key))
 
     def __or__(self, other) -> "IntervalDict[atomic.TO, V]":
@@ -304,6 +331,44 @@ class IntervalDict(
         copy._mapping = self._mapping.copy()
         return copy
 
+    def as_canonical(
+        self,
+    ) -> Tuple[Tuple[atomic.TO, atomic.TO, Optional[bool], Optional[bool], V], ...]:
+        """
+        Return the canonical tuple form of the dictionary.
+
+        Each item is described by its lower value, its upper value, its lower
+        closure, its upper closure and its associated value. Closures follow the
+        :meth:`Atomic.from_tuple` convention (:code:`True` for a closed bound and
+        :code:`None` for an open one). Comparing these tuples is cheaper than
+        comparing string representations.
+
+        Returns
+        -------
+            tuple
+                The canonical tuple form of the dictionary.
+
+        Examples
+        --------
+
+            >>> from part import FrozenIntervalDict
+            >>> a = FrozenIntervalDict[int, int]({(10, 15): 1, (20, 25, True, True): 2})
+            >>> a.as_canonical()
+            ((10, 15, True, None, 1), (20, 25, True, True, 2))
+        """
+        mapping = self._mapping
+        # pylint: disable=protected-access
+        return tuple(
+            (
+                interval._lower.value,
+                interval._upper.value,
+                interval._lower.type == 0 or None,
+                interval._upper.type == 0 or None,
+                mapping[interval],
+            )
+            for interval in self._intervals  # type: ignore
+        )
+
     @staticmethod
     def _interval(key):
         if isinstance(key, slice):
@@ -314,6 +379,9 @@ class IntervalDict(
     def _from_slice(key):
         if key.step is not None:
             raise ValueError("step is not authorized in slices")
+        if key.start is not None and key.stop is not None and key.start >= key.stop:
+            # [a;b) is always empty when b <= a, no need to build it
+            return atomic.Empty()
         return atomic.Interval(key.start, key.stop)
 
     def select(
@@ -359,28 +427,48 @@ class IntervalDict(
             >>> [str(interval) for interval in a.select((2, 9), strict=False)]
             ['[2;2]', '[6;7)', '(8;10)']
         """
-        if not value:
-            return
-        interval = atomic.Atomic.from_value(value)
-        index = self._bisect_left(interval)
-        if (
-            strict
-            and index < len(self)
-            and self._intervals[index].lower < interval.lower  # type: ignore
-        ):
-            index += 1
-        while index < len(self):
-            other = self._intervals[index]  # type: ignore
-            if other.lower <= interval.upper:
-                if other.upper > interval.upper:
-                    if strict:
-                        return
-                    yield other
-                    return
-                yield other
-            else:
-                return
-            index += 1
+        return _select(self, value, strict)
+
+    def gaps(
+        self, value: atomic.IntervalValue[atomic.TO]
+    ) -> Iterator[atomic.Interval[atomic.TO]]:
+        """
+        Select all parts of *value* that are not covered by the dictionary.
+
+        Arguments
+        ---------
+            value: :class:`IntervalValue`
+                The value to search:
+
+                * :class:`Atomic`
+                * :class:`TO <TotallyOrdered>`
+                * :class:`Tuple[TO, TO] <python:tuple>`
+                * :class:`Tuple[TO, TO, Optional[bool]] <python:tuple>`
+                * :class:`Tuple[TO, TO, Optional[bool], Optional[bool]] <python:tuple>`
+
+        Returns
+        -------
+            :class:`Iterator[Interval]] <python:typing.Iterator>`
+                An iterator over the uncovered intervals.
+
+        Examples
+        --------
+
+            >>> from part import FrozenIntervalDict
+            >>> a = FrozenIntervalDict[int, int](
+            ...     [
+            ...         (2, 1),
+            ...         ((6, 7), 2),
+            ...         ((8, 10, None), 3),
+            ...         ((11, 13, True, True), 4)
+            ...     ]
+            ... )
+            >>> [str(interval) for interval in a.gaps((5, 9))]
+            ['[5;6)', '[7;8]']
+            >>> [str(interval) for interval in a.gaps((0, 12))]
+            ['[0;2)', '(2;6)', '[7;8]', '[10;11)']
+        """
+        return _gaps(self, value)
 
     def compress(self) -> "IntervalDict[atomic.TO, V]":
         """
@@ -409,36 +497,53 @@ class IntervalDict(
             >>> print(b)
             {'[10;25)': 1, '[30;45)': 2}
         """
+        # pylint: disable=protected-access
         result = self.__class__()
         intervals = []
-        if self:
-            iterator = iter(self)
-            current = atomic.Atomic.from_value(next(iterator))
-            value = self._mapping[current]
-            while True:
-                # pylint: disable=protected-access
-                try:
-                    interval = next(iterator)
-                    if self._mapping[interval] == value and current.upper.near(
-                        interval.lower
-                    ):
-                        current._upper = interval.upper
-                    else:
-                        intervals.append(current)
-                        result._mapping[current] = value
-                        current = atomic.Atomic.from_value(interval)
-                        value = self._mapping[current]
-                except StopIteration:
-                    intervals.append(current)
-                    result._update_intervals(intervals)
-                    result._mapping[current] = value
-                    break
+        for interval, value in self._compress():
+            intervals.append(interval)
+            result._mapping[interval] = value
+        result._update_intervals(intervals)
         return result
 
+    def _compress(self) -> Iterator[Tuple[atomic.Interval[atomic.TO], V]]:
+        # Yield the compressed items, reusing the intervals that are not merged
+        for first, last, value in self._runs():
+            yield self._merge(first, last), value
+
+    def _runs(self):
+        # Yield the runs of adjacent intervals holding equal values as their first
+        # and last intervals and their value
+        first = last = None
+        value = None
+        for interval in self._intervals:  # type: ignore
+            current = self._mapping[interval]
+            if last is not None:
+                if current == value and last.upper.near(interval.lower):
+                    last = interval
+                    continue
+                yield first, last, value
+            first = last = interval
+            value = current
+        if last is not None:
+            yield first, last, value
+
+    @staticmethod
+    def _merge(first, last):
+        if first is last:
+            return first
+        # Never modify the keys of self
+        # pylint: disable=protected-access
+        return atomic.Interval._from_marks(first.lower, last.upper)
+
     @abstractmethod
     def _bisect_left(self, search):  #  pylint: disable=invalid-name
         raise NotImplementedError
 
+    @abstractmethod
+    def _islice(self, start):
+        raise NotImplementedError
+
     @abstractmethod
     def _update_intervals(self, intervals) -> None:
         raise NotImplementedError
@@ -495,6 +600,10 @@ class FrozenIntervalDict(
     def _bisect_left(self, search) -> int:
         return bisect.bisect_left(self._intervals, search)
 
+    def _islice(self, start):
+        intervals = self._intervals
+        return map(intervals.__getitem__, range(start, len(intervals)))
+
     def _update_intervals(self, intervals) -> None:
         self._intervals = intervals
 
@@ -529,6 +638,7 @@ class MutableIntervalDict(
         :meth:`__ior__`            :math:`O(m\\log(n+m))`
         :meth:`update`             :math:`O((\\sum_{i=1}^kn_i)\\log(\\sum_{i=0}^kn_i))`
         :meth:`clear`              :math:`O(1)`
+        :meth:`compress_inplace`   :math:`O(n)`
         =========================  ====================================================
     """
 
@@ -597,16 +707,19 @@ class MutableIntervalDict(
         self._default = default
         self._operator = operator
         self._strict = strict
-        if isinstance(iterable, IntervalDict):
+        if isinstance(iterable, MutableIntervalDict):
+            self._mapping = iterable._mapping.copy()
+            self._intervals = self._clone(iterable._intervals)
+        elif isinstance(iterable, IntervalDict):
             self._mapping = iterable._mapping.copy()
-            self._intervals = SortedSet(iterable._intervals)
+            self._intervals = self._sorted(iterable._intervals)
         else:
             self._mapping = {}
-            self._intervals: SortedSet = SortedSet()
-            if isinstance(iterable, dict):
-                self.update(*({key: value} for key, value in iterable.items()))
+            self._intervals: SortedKeyList = self._sorted()
+            if isinstance(iterable, collections.abc.Mapping):
+                self._initialize(iterable.items())
             elif iterable is not None:
-                self.update(*({key: value} for key, value in iterable))  # type: ignore
+                self._initialize(iterable)  # type: ignore
 
     def __getitem__(self, key: Union[slice, atomic.IntervalValue[atomic.TO]]) -> V:
         """
@@ -710,28 +823,73 @@ class MutableIntervalDict(
         """
         self._remove(key)
 
+    def _initialize(self, items):
+        # pylint: disable=protected-access
+        pairs = [
+            (interval, value)
+            for interval, value in (
+                (atomic.Atomic.from_value(key), value) for key, value in items
+            )
+            if interval
+        ]
+        ordered = sorted(pairs, key=lambda pair: pair[0]._lower)
+        if all(
+            previous._upper < following._lower
+            for (previous, _), (following, _) in zip(ordered, ordered[1:])
+        ):
+            # Disjoint keys (as in most literals) do not depend on their order, they
+            # are sorted once and stored in one step
+            self._intervals = self._sorted(interval for interval, _ in ordered)
+            self._mapping = dict(ordered)
+        else:
+            self.update(*({interval: value} for interval, value in pairs))
+
     def _remove(self, key):
         # pylint: disable=protected-access
         interval = IntervalDict._interval(key)
         if interval:
-            start = self._start(interval)
-            stop = self._stop(interval)
-            for index in range(start, stop):
-                del self._mapping[self._intervals[index]]
-            del self._intervals[start:stop]
+            self._splice(interval)
         return interval
 
     def _add(self, interval, value):
         if self._operator is None:
             self[interval] = value
-        else:
-            intervals = list(self.select(interval, strict=False))
-            for another in ((interval & found)[0] for found in intervals):
-                self[another] = self._operator(self[another], value)
-            for another in sets.FrozenIntervalSet[atomic.TO](
-                [interval]
-            ) - sets.FrozenIntervalSet[atomic.TO](intervals):
-                self[another] = value
+        elif interval:
+            # pylint: disable=protected-access
+            # Sweep the overlapped intervals once: fully covered intervals only get
+            # their value combined, the (at most two) intervals crossing a bound of
+            # *interval* are split, and the gaps are filled with the value.
+            mapping = self._mapping
+            marks = atomic.Interval._from_marks
+            start, stop = interval.lower, interval.upper
+            pieces = []
+            crossing = []
+            lower = start
+            for found in self._intervals.islice(self._bisect_left(interval)):
+                if found.lower > stop:
+                    break
+                old = mapping[found]
+                if found.lower < start or stop < found.upper:
+                    crossing.append(found)
+                    if found.lower < start:
+                        pieces.append((marks(found.lower, start.prev()), old))
+                    if stop < found.upper:
+                        pieces.append((marks(stop.next(), found.upper), old))
+                    common = marks(max(found.lower, start), min(found.upper, stop))
+                    pieces.append((common, self._operator(old, value)))
+                else:
+                    common = found
+                    mapping[found] = self._operator(old, value)
+                if lower < common.lower:
+                    pieces.append((marks(lower, common.lower.prev()), value))
+                lower = common.upper.next()
+            if lower <= stop:
+                pieces.append((marks(lower, stop), value))
+            for found in crossing:
+                self._intervals.remove(found)
+                del mapping[found]
+            self._intervals.update(piece for piece, _ in pieces)
+            mapping.update(pieces)
 
     def __or__(self, other) -> "MutableIntervalDict[atomic.TO, V]":
         """
@@ -887,7 +1045,12 @@ class MutableIntervalDict(
         ],
     ) -> None:
         for other in args:
-            if isinstance(other, collections.abc.Mapping):
+            if isinstance(other, IntervalDict):
+                # The keys are already disjoint intervals: the order does not matter
+                # pylint: disable=protected-access
+                for interval, value in list(other._mapping.items()):
+                    self._add(interval, value)
+            elif isinstance(other, collections.abc.Mapping):
                 for key, value in other.items():
                     self._add(atomic.Atomic.from_value(key), value)
             elif isinstance(other, collections.abc.Iterable):
@@ -899,26 +1062,30 @@ class MutableIntervalDict(
     # pylint: disable=protected-access
     @classmethod
     def _rest(cls, rest, cursors, index, element):
-        if cursors[index] < len(element):
-            interval = element._intervals[cursors[index]]
-            value = element._mapping[interval]
-            rest.add((interval.lower, interval.upper, index, value))
+        intervals, mapping = element
+        if cursors[index] < len(intervals):
+            interval = intervals[cursors[index]]
+            value = mapping[interval]
+            heapq.heappush(rest, (interval.lower, interval.upper, index, value))
 
     # pylint: disable=protected-access
     def _create(self, *args):
-        # Create a list of non empty IntervalDict
+        # Create a list of (intervals, mapping) for the non empty IntervalDict: the
+        # sorted intervals are copied once into a list which is read by position
+        # during the sweep
         elements = []
         for element in itertools.chain([self], args):
             if not isinstance(element, IntervalDict):
                 element = FrozenIntervalDict(element)
             if element:
-                elements.append(element)
+                elements.append((list(element._intervals), element._mapping))
 
         cursors = [0] * len(elements)
 
-        current = SortedList()
+        # current and rest are heaps of the active and the pending intervals
+        current = []
 
-        rest = SortedList()
+        rest = []
         for index, element in enumerate(elements):
             self._rest(rest, cursors, index, element)
 
@@ -930,8 +1097,7 @@ class MutableIntervalDict(
 
         # Remove useless elements from current
         while current and current[0][0] == upper:
-            (_, _, index, _) = current[0]
-            del current[0]
+            (_, _, index, _) = heapq.heappop(current)
             cursors[index] += 1
             element = elements[index]
             cls._rest(rest, cursors, index, element)
@@ -943,9 +1109,8 @@ class MutableIntervalDict(
 
         # Move elements from rest to current
         while rest and rest[0][0] == lower:
-            (lower, upper, index, value) = rest[0]
-            del rest[0]
-            current.add((upper, lower, index, value))
+            (lower, upper, index, value) = heapq.heappop(rest)
+            heapq.heappush(current, (upper, lower, index, value))
 
         if current:
             upper = current[0][0]
@@ -966,120 +1131,166 @@ class MutableIntervalDict(
         mapping = {}
 
         (elements, cursors, current, rest) = self._create(*args)
+        if not rest:
+            return
         (lower, upper) = self._next(-atomic.INFINITY, elements, cursors, current, rest)
 
+        operator = self._operator
         while current:
-            interval = atomic.Interval[atomic.TO](
-                lower_value=lower.value,
-                lower_closed=lower.type == 0,
-                upper_value=upper.value,
-                upper_closed=upper.type == 0,
-            )
-            value = reduce(
-                self._operator, (value for (_, _, _, value) in current)  # type: ignore
-            )
+            interval = atomic.Interval._from_marks(lower, upper)
+            if len(current) == 1:
+                # A single active value needs no reduction
+                value = current[0][3]
+            else:
+                value = reduce(
+                    operator, (value for (_, _, _, value) in current)  # type: ignore
+                )
             intervals.append(interval)
             mapping[interval] = value
             (lower, upper) = self._next(upper, elements, cursors, current, rest)
 
-        self._intervals = SortedSet(intervals)
+        self._intervals = self._sorted(intervals)
         self._mapping = mapping
 
     def clear(self) -> None:
         """Remove all items from self (same as del self[:])."""
-        self._intervals = SortedSet()
+        self._intervals = self._sorted()
         self._mapping = {}
 
-    def _start(self, interval):
-        start = self._intervals.bisect_left(interval)
-        if start < len(self._intervals):
-            start_interval = self._intervals[start]
-            start_value = self._mapping[start_interval]
-            if self._intervals[start].overlaps(interval, strict=False):
-                del self._intervals[start]
-                del self._mapping[start_interval]
-                if self._insert(
-                    (
-                        start_interval.lower_value,
-                        interval.lower_value,
-                        start_interval.lower_closed,
-                        not interval.lower_closed,
-                    ),
-                    start_value,
-                ):
-                    start += 1
-            elif interval.overlaps(self._intervals[start], strict=False):
-                del self._intervals[start]
-                del self._mapping[start_interval]
-                if self._insert(
-                    (
-                        interval.upper_value,
-                        start_interval.upper_value,
-                        not interval.upper_closed,
-                        start_interval.upper_closed,
-                    ),
-                    start_value,
-                ):
-                    start += 1
-            elif interval.during(self._intervals[start], strict=False):
-                del self._intervals[start]
-                del self._mapping[start_interval]
-                if self._insert(
-                    (
-                        start_interval.lower_value,
-                        interval.lower_value,
-                        start_interval.lower_closed,
-                        not interval.lower_closed,
-                    ),
-                    start_value,
-                ):
-                    start += 1
-                if self._insert(
-                    (
-                        interval.upper_value,
-                        start_interval.upper_value,
-                        not interval.upper_closed,
-                        start_interval.upper_closed,
-                    ),
-                    start_value,
-                ):
-                    start += 1
-        return start
-
-    def _stop(self, interval):
-        stop = self._intervals.bisect_right(interval)
-        if 0 < stop <= len(self._intervals):
-            stop -= 1
-            stop_interval = self._intervals[stop]
-            stop_value = self._mapping[stop_interval]
-            if self._intervals[stop].during(interval, strict=False):
-                del self._intervals[stop]
-                del self._mapping[stop_interval]
-            elif interval.overlaps(self._intervals[stop], strict=False):
-                del self._intervals[stop]
-                del self._mapping[stop_interval]
-                self._insert(
-                    (
-                        interval.upper_value,
-                        stop_interval.upper_value,
-                        not interval.upper_closed,
-                        stop_interval.upper_closed,
-                    ),
-                    stop_value,
-                )
+    def copy(self) -> "MutableIntervalDict[atomic.TO, V]":
+        """
+        Return a shallow copy of the dictionary.
 
-        return stop
+        The copy shares the *default*, *operator* and *strict* settings of the
+        dictionary.
 
-    def _insert(self, key, value):
-        interval = atomic.Atomic.from_tuple(key)
-        if interval:
+        Returns
+        -------
+            :class:`MutableIntervalDict`
+                A shallow copy of the dictionary.
+
+        Examples
+        --------
+
+            >>> from part import MutableIntervalDict
+            >>> a = MutableIntervalDict[int, set](
+            ...     {(10, 15): {1}}, default=set
+            ... )
+            >>> b = a.copy()
+            >>> b[(20, 25)]
+            set()
+            >>> print(b)
+            {'[10;15)': {1}, '[20;25)': set()}
+            >>> print(a)
+            {'[10;15)': {1}}
+        """
+        copy = self.__class__(
+            default=self._default, operator=self._operator, strict=self._strict
+        )
+        # pylint: disable=protected-access
+        copy._intervals = self._clone(self._intervals)
+        copy._mapping = self._mapping.copy()
+        return copy
+
+    def compress_inplace(self) -> "MutableIntervalDict[atomic.TO, V]":
+        """
+        Compress the dictionary in place.
+
+        Adjacent intervals holding equal values are merged. Unlike
+        :meth:`compress`, no new dictionary is created: only the merged runs are
+        replaced and the other intervals are kept as is.
+
+        Returns
+        -------
+            :class:`MutableIntervalDict`
+                The dictionary itself, for chaining.
+
+        Examples
+        --------
+
+            >>> from part import MutableIntervalDict
+            >>> a = MutableIntervalDict[int, int](
+            ...     {(10, 15): 1, (14, 25): 1, (30, 35): 2, (33, 45): 2}
+            ... )
+            >>> print(a.compress_inplace())
+            {'[10;25)': 1, '[30;45)': 2}
+        """
+        runs = list(self._runs())
+        intervals = self._intervals
+        merged = len(intervals) - len(runs)
+        if 8 * merged > len(intervals):
+            # Each removal from the sorted list costs a few times more than sorting
+            # one interval again: many merges are cheaper to rebuild at once
+            items = [(self._merge(first, last), value) for first, last, value in runs]
+            self._intervals = self._sorted(interval for interval, _ in items)
+            self._mapping = dict(items)
+        elif merged:
+            # Only the merged runs are spliced. They are located by key: positional
+            # access would rebuild the index of the sorted list after each removal.
+            mapping = self._mapping
+            for first, last, value in runs:
+                if first is not last:
+                    for interval in list(intervals.irange_key(first.upper, last.upper)):
+                        intervals.remove(interval)
+                        del mapping[interval]
+                    self._insert(first.lower, last.upper, value)
+        return self
+
+    def _splice(self, interval):
+        # Locate the overlapped intervals with two searches on the upper marks: the
+        # first one is the first upper not below the lower bound of *interval* and
+        # the intervals ending inside *interval* are all removed. The intervals
+        # crossing a bound keep their part outside *interval*.
+        intervals = self._intervals
+        lower, upper = interval.lower, interval.upper
+        start = intervals.bisect_key_left(lower)
+        stop = intervals.bisect_key_right(upper)
+        if stop < len(intervals) and intervals[stop].lower <= upper:
+            stop += 1
+        if start == stop:
+            return
+        # The values are popped in the same pass as the keys are removed
+        removed = intervals[start:stop]
+        values = list(map(self._mapping.pop, removed))
+        del intervals[start:stop]
+        first, last = removed[0], removed[-1]
+        if first.lower < lower:
+            self._insert(first.lower, lower.prev(), values[0])
+        if upper < last.upper:
+            self._insert(upper.next(), last.upper, values[-1])
+
+    def _insert(self, lower, upper, value):
+        # Insert the interval between the lower and upper marks if it is not empty
+        if lower <= upper:
+            interval = atomic.Interval._from_marks(lower, upper)
             self._intervals.add(interval)
             self._mapping[interval] = value
             return True
         return False
 
     def _bisect_left(self, search) -> int:
-        return self._intervals.bisect_left(search)
+        if search:
+            return self._intervals.bisect_key_left(search.lower)
+        return 0
+
+    def _islice(self, start):
+        return self._intervals.islice(start)
 
     def _update_intervals(self, intervals) -> None:
-        self._intervals = SortedSet(intervals)
+        self._intervals = self._sorted(intervals)
+
+    @staticmethod
+    def _sorted(intervals=None):
+        # Disjoint intervals are sorted like their upper marks. Keeping these marks
+        # as keys lets the searches compare tuples instead of calling Interval.__lt__:
+        # the first interval not before a search is the first upper not below its
+        # lower mark.
+        return SortedKeyList(intervals, key=_UPPER)
+
+    @staticmethod
+    def _clone(intervals):
+        # The intervals are already sorted: filling an empty list only costs a
+        # linear pass of the sort and never goes through the insertion path.
+        clone = SortedKeyList(key=_UPPER)
+        clone.update(intervals)
+        return clone
@@ -3,9 +3,9 @@
 # pylint: disable=too-many-lines
 
 import bisect
-import copy
 import heapq
 from abc import abstractmethod, ABCMeta
+from operator import attrgetter
 from typing import (
     Optional,
     Iterable,
@@ -18,10 +18,60 @@ from typing import (
 )
 
 # pylint: disable=too-few-public-methods,import-error
-from sortedcontainers import SortedSet  # type: ignore
+from sortedcontainers import SortedKeyList  # type: ignore
 
 from part import atomic, values
 
+_LOWER = attrgetter("_lower")
+_UPPER = attrgetter("_upper")
+
+
+def _select(container, value, strict):
+    # Select the sorted disjoint intervals of *container* (an interval set or an
+    # interval dictionary) overlapping *value*: they follow the first one located by
+    # bisection.
+    # pylint: disable=protected-access
+    if not value:
+        return
+    interval = atomic.Atomic.from_value(value)
+    if not interval:
+        return
+    lower = interval.lower
+    upper = interval.upper
+    for other in container._islice(container._bisect_left(interval)):
+        if strict and other.lower < lower:
+            # Only the first interval can start before the searched one
+            continue
+        if other.lower > upper:
+            return
+        if other.upper > upper:
+            if not strict:
+                yield other
+            return
+        yield other
+
+
+def _gaps(container, value):
+    # Select the parts of *value* between the sorted disjoint intervals of
+    # *container* (an interval set or an interval dictionary).
+    # pylint: disable=protected-access
+    if not value:
+        return
+    interval = atomic.Atomic.from_value(value)
+    if not interval:
+        return
+    lower = interval.lower
+    upper = interval.upper
+    for other in container._islice(container._bisect_left(interval)):
+        if other.lower > upper:
+            break
+        if lower < other.lower:
+            yield atomic.Interval._from_marks(lower, other.lower.prev())
+        lower = other.upper.next()
+        if lower > upper:
+            return
+    yield atomic.Interval._from_marks(lower, upper)
+
 
 class IntervalSet(
     Generic[atomic.TO], AbstractSet[atomic.Interval[atomic.TO]], metaclass=ABCMeta
@@ -113,25 +163,33 @@ class IntervalSet(
                 intervals.append(atomic.Atomic.from_value(item))
 
         # pylint: disable=protected-access
-        intervals = sorted(intervals, key=lambda elem: elem._lower)
+        intervals = sorted(intervals, key=_LOWER)
 
         if intervals:
-            current = copy.copy(intervals[0])
-            for interval in intervals[1:]:
+            # Intervals that are not merged are shared (they are never modified), a
+            # new one is only created for merged runs. The runs are stored at once.
+            merged = []
+            iterator = iter(intervals)
+            current = next(iterator)
+            upper = current._upper
+            for interval in iterator:
+                lower = interval._lower
                 if (
-                    interval._lower <= current._upper
-                    or interval._lower.value == current._upper.value
-                    and (interval._lower.type == 0 or current._upper.type == 0)
+                    lower <= upper
+                    or lower.value == upper.value
+                    and (lower.type == 0 or upper.type == 0)
                 ):
-                    current._upper = max(current._upper, interval._upper)
+                    upper = max(upper, interval._upper)
                 else:
-                    self._append(current)
-                    current = copy.copy(interval)
-            self._append(current)
+                    merged.append(self._merged(current, upper))
+                    current = interval
+                    upper = current._upper
+            merged.append(self._merged(current, upper))
+            self._extend(merged)
 
     def __str__(self) -> str:
         """Return str(self)."""
-        return " | ".join(str(interval) for interval in self)
+        return " | ".join(map(str, self))
 
     def __eq__(self, other):
         """Return self==other."""
@@ -340,11 +398,10 @@ class IntervalSet(
         try:
             interval = atomic.Atomic.from_value(value)
             index = self._bisect_left(interval)
-            return (
-                index < len(self)
-                and self[index].lower <= interval.lower
-                and interval.upper <= self[index].upper
-            )
+            if index < len(self):
+                found = self[index]
+                return found.lower <= interval.lower and interval.upper <= found.upper
+            return False
         except TypeError:
             return False
 
@@ -566,9 +623,7 @@ class IntervalSet(
             (-inf;2) | [8;10) | (11;+inf)
         """
         result = self.__class__()
-        for interval in self._invert():
-            if interval:
-                result._append(interval)
+        result._extend(interval for interval in self._invert() if interval)
         return result
 
     def __reversed__(self) -> Iterator[atomic.Interval[atomic.TO]]:
@@ -597,10 +652,32 @@ class IntervalSet(
     def _append(self, item) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def _extend(self, items) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _islice(self, start):
+        raise NotImplementedError
+
     @abstractmethod
     def _bisect_left(self, search, lo=0, hi=None):  #  pylint: disable=invalid-name
         raise NotImplementedError
 
+    def _apart(self, other) -> bool:
+        # Is self entirely before other without touching it?
+        # pylint: disable=protected-access
+        upper = self[-1]._upper
+        lower = other[0]._lower
+        return lower > upper and not lower.near(upper)
+
+    @staticmethod
+    def _merged(interval, upper):
+        # pylint: disable=protected-access
+        if upper is interval._upper:
+            return interval
+        return atomic.Interval._from_marks(interval._lower, upper)
+
     @staticmethod
     def _items(*args):
         items = []
@@ -626,7 +703,8 @@ class IntervalSet(
             if intervals:
                 heap.append((intervals[0]._lower, index + 1, intervals, 0))
 
-        max_sup = atomic.Mark(value=-values.INFINITY, type=1)
+        # Sorts strictly before every lower mark, including an unbounded one
+        max_sup = atomic.Mark(value=-values.INFINITY, type=-1)
         min_inf = atomic.Mark(value=+values.INFINITY, type=-1)
 
         # transform into a priority queue O(n)
@@ -634,37 +712,35 @@ class IntervalSet(
 
         # Loop for each interval (there is k-n intervals remaining)
         while heap:
-            # get the minimal inf
+            # get the minimal inf, the sorted intervals are read directly from their
+            # inner storage
             (inf, index, intervals, cursor) = heap[0]
-            sup = intervals[cursor]._upper
+            stored = intervals._intervals  # type: ignore
+            sup = stored[cursor]._upper
 
             # output interval as a tuple if not empty
             if inf > max_sup and not inf.near(max_sup):
                 if min_inf <= max_sup:
-                    interval = atomic.Interval[atomic.TO]()
-                    interval._lower = min_inf
-                    interval._upper = max_sup
-                    yield interval
+                    yield atomic.Interval._from_marks(min_inf, max_sup)
                 min_inf = inf
             max_sup = max(max_sup, sup)
 
-            search = atomic.Atomic.from_value(max_sup.value)
-
-            # get the next interval for this list using array bisection algorithm
-            cursor = intervals._bisect_left(search, lo=cursor + 1)
-            if cursor < len(intervals):
+            # get the next interval for this list, using array bisection algorithm
+            # only when the following interval is already covered
+            cursor += 1
+            if cursor < len(stored) and stored[cursor]._upper < max_sup:
+                search = atomic.Atomic.from_value(max_sup.value)
+                cursor = intervals._bisect_left(search, lo=cursor + 1)
+            if cursor < len(stored):
                 # remove first item and insert new item in O(log(n))
                 heapq.heapreplace(
-                    heap, (intervals[cursor]._lower, index, intervals, cursor)
+                    heap, (stored[cursor]._lower, index, intervals, cursor)
                 )
             else:
                 heapq.heappop(heap)
 
         if min_inf <= max_sup:
-            interval = atomic.Interval[atomic.TO]()
-            interval._lower = min_inf
-            interval._upper = max_sup
-            yield interval
+            yield atomic.Interval._from_marks(min_inf, max_sup)
 
     def _intersection(self, *args) -> Iterator[atomic.Interval[atomic.TO]]:
         # pylint: disable=protected-access,no-member
@@ -696,28 +772,28 @@ class IntervalSet(
 
         # Loop for each interval (there is k-n intervals remaining)
         while True:
-            # get the minimal sup
+            # get the minimal sup, the sorted intervals are read directly from their
+            # inner storage
             (sup, index, intervals, cursor) = heap[0]
+            stored = intervals._intervals  # type: ignore
 
             # output interval as a tuple if not empty
             if max_inf <= sup:
-                interval = atomic.Interval[atomic.TO]()
-                interval._lower = max_inf
-                interval._upper = sup
-                yield interval
-
-            search = atomic.Atomic.from_value(max_inf.value)
-
-            # get the next interval for this list using array bisection algorithm
-            cursor = intervals._bisect_left(search, lo=cursor + 1)
-            if cursor < len(intervals):
+                yield atomic.Interval._from_marks(max_inf, sup)
+
+            # get the next interval for this list, using array bisection algorithm
+            # only when the following interval ends before the current lower bound
+            cursor += 1
+            if cursor < len(stored) and stored[cursor]._upper < max_inf:
+                search = atomic.Atomic.from_value(max_inf.value)
+                cursor = intervals._bisect_left(search, lo=cursor)
+            if cursor < len(stored):
+                interval = stored[cursor]
                 # update max_inf if necessary
-                max_inf = max(max_inf, intervals[cursor]._lower)
+                max_inf = max(max_inf, interval._lower)
 
                 # remove first item and insert new item in O(log(n))
-                heapq.heapreplace(
-                    heap, (intervals[cursor]._upper, index, intervals, cursor)
-                )
+                heapq.heapreplace(heap, (interval._upper, index, intervals, cursor))
             else:
                 return
 
@@ -888,9 +964,8 @@ class IntervalSet(
             [0;12) | [13;30)
         """
         result = self.__class__()
-        for item in self._union(*args):
-            # pylint: disable=protected-access
-            result._append(item)
+        # pylint: disable=protected-access
+        result._extend(self._union(*args))
         return result
 
     def intersection(
@@ -967,9 +1042,8 @@ class IntervalSet(
             [1;2) | [5;5] | [8;9) | [16;18) | [20;23) | [24;24]
         """
         result = self.__class__()
-        for item in self._intersection(*args):
-            # pylint: disable=protected-access
-            result._append(item)
+        # pylint: disable=protected-access
+        result._extend(self._intersection(*args))
         return result
 
     def difference(
@@ -1086,24 +1160,38 @@ class IntervalSet(
             ... )
             ['[2;2]', '[6;7)', '(8;10)']
         """
-        if not value:
-            return
-        interval = atomic.Atomic.from_value(value)
-        index = self._bisect_left(interval)
-        if strict and index < len(self) and self[index].lower < interval.lower:
-            index += 1
-        while index < len(self):
-            other = self[index]
-            if other.lower <= interval.upper:
-                if other.upper > interval.upper:
-                    if strict:
-                        return
-                    yield other
-                    return
-                yield other
-            else:
-                return
-            index += 1
+        return _select(self, value, strict)
+
+    def gaps(
+        self, value: atomic.IntervalValue[atomic.TO]
+    ) -> Iterator[atomic.Interval[atomic.TO]]:
+        """
+        Select the parts of *value* that lie between the intervals of the set.
+
+        Arguments
+        ---------
+            value: :class:`IntervalValue`
+                The value whose uncovered parts are searched.
+
+        Returns
+        -------
+            :class:`Iterator[Interval] <python:typing.Iterator>`
+                An iterator over the uncovered intervals, in order.
+
+        See also
+        --------
+
+            select: the intervals of the set that overlap *value*.
+
+        Examples
+        --------
+
+            >>> from part import MutableIntervalSet
+            >>> a = MutableIntervalSet[int]([(0, 3), (5, 8, None, True)])
+            >>> print(" | ".join(map(str, a.gaps((None, 10)))))
+            (-inf;0) | [3;5] | (8;10)
+        """
+        return _gaps(self, value)
 
 
 class FrozenIntervalSet(
@@ -1204,9 +1292,16 @@ class FrozenIntervalSet(
             hi = len(self)
         return bisect.bisect_left(self._intervals, search, lo=lo, hi=hi)
 
+    def _islice(self, start):
+        intervals = self._intervals
+        return map(intervals.__getitem__, range(start, len(intervals)))
+
     def _append(self, item) -> None:
         self._intervals.append(item)
 
+    def _extend(self, items) -> None:
+        self._intervals.extend(items)
+
 
 # pylint: disable=too-many-ancestors
 class MutableIntervalSet(
@@ -1290,7 +1385,7 @@ class MutableIntervalSet(
             >>> print(a)
             [2;2] | [6;7) | (8;10) | [11;13]
         """
-        self._intervals: SortedSet = SortedSet()
+        self._intervals: SortedKeyList = self._sorted()
         super().__init__(iterable)
 
     def __ior__(self, other) -> "MutableIntervalSet[atomic.TO]":  # type: ignore
@@ -1428,16 +1523,75 @@ class MutableIntervalSet(
     def _bisect_left(self, search, lo=0, hi=None) -> int:
         if hi is None:
             hi = len(self)
-        cursor = self._intervals.bisect_left(search)
+        cursor = self._intervals.bisect_key_left(search.lower) if search else 0
         if cursor < lo:
             cursor = lo
         if cursor >= hi:
             cursor = hi
         return cursor
 
+    def _islice(self, start):
+        return self._intervals.islice(start)
+
     def _append(self, item) -> None:
         self._intervals.add(item)
 
+    def _extend(self, items) -> None:
+        self._intervals.update(items)
+
+    @staticmethod
+    def _sorted(intervals=None):
+        # Disjoint intervals are sorted like their upper marks, searching these keys
+        # compares tuples instead of calling Interval.__lt__
+        return SortedKeyList(intervals, key=_UPPER)
+
+    def _add(self, interval) -> None:
+        # Only the intervals overlapping or touching *interval* are merged with it,
+        # the others are untouched.
+        # pylint: disable=protected-access
+        intervals = self._intervals
+        lower, upper = interval._lower, interval._upper
+        start = intervals.bisect_key_left(lower)
+        if start and lower.near(intervals[start - 1]._upper):
+            start -= 1
+        stop = start
+        for found in intervals.islice(start):
+            if found._lower > upper and not found._lower.near(upper):
+                break
+            stop += 1
+        if start == stop:
+            intervals.add(interval)
+            return
+        first = intervals[start]
+        last = intervals[stop - 1]
+        if stop - start == 1 and first._lower <= lower and upper <= first._upper:
+            return
+        del intervals[start:stop]
+        intervals.add(
+            atomic.Interval._from_marks(
+                min(lower, first._lower), max(upper, last._upper)
+            )
+        )
+
+    def _discard(self, interval, start) -> None:
+        # Only the intervals overlapping *interval* (from the first one not before
+        # it) are replaced by their parts outside of it, the others are untouched.
+        # pylint: disable=protected-access
+        intervals = self._intervals
+        lower, upper = interval._lower, interval._upper
+        stop = start
+        pieces = []
+        for found in intervals.islice(start):
+            if found._lower > upper:
+                break
+            if found._lower < lower:
+                pieces.append(atomic.Interval._from_marks(found._lower, lower.prev()))
+            if upper < found._upper:
+                pieces.append(atomic.Interval._from_marks(upper.next(), found._upper))
+            stop += 1
+        del intervals[start:stop]
+        intervals.update(pieces)
+
     def update(self, *args: Iterable[atomic.IntervalValue[atomic.TO]]) -> None:
         """
         Update the set, keeping only elements found in it and all others.
@@ -1453,6 +1607,17 @@ class MutableIntervalSet(
             TypeError
                 if an argument is not iterable.
         """
+        if len(args) == 1 and isinstance(args[0], IntervalSet):
+            # pylint: disable=protected-access
+            other = args[0]
+            if not self or not other or self._apart(other) or other._apart(self):
+                # Nothing to merge: the intervals of other are inserted as is
+                self._extend(other)
+                return
+            if len(other) == 1:
+                # A single interval is merged locally
+                self._add(other[0])
+                return
         result = self.union(*args)
         # pylint: disable=protected-access
         self._intervals = result._intervals  # type: ignore
@@ -1474,6 +1639,9 @@ class MutableIntervalSet(
             TypeError
                 if an argument is not iterable.
         """
+        if len(args) == 1 and isinstance(args[0], IntervalSet) and not args[0]:
+            self._intervals.clear()
+            return
         result = self.intersection(*args)
         # pylint: disable=protected-access
         self._intervals = result._intervals  # type: ignore
@@ -1495,6 +1663,16 @@ class MutableIntervalSet(
             TypeError
                 if an argument is not iterable.
         """
+        if len(args) == 1 and isinstance(args[0], IntervalSet):
+            other = args[0]
+            if not other:
+                return
+            if len(other) == 1:
+                # A single interval is removed locally
+                # pylint: disable=protected-access
+                interval = other[0]
+                self._discard(interval, self._intervals.bisect_key_left(interval.lower))
+                return
         result = self.difference(*args)
         # pylint: disable=protected-access
         self._intervals = result._intervals  # type: ignore
@@ -1516,6 +1694,8 @@ class MutableIntervalSet(
             TypeError
                 if *other* is not iterable.
         """
+        if isinstance(other, IntervalSet) and not other:
+            return
         result = self.symmetric_difference(other)
         # pylint: disable=protected-access
         self._intervals = result._intervals  # type: ignore
@@ -1550,7 +1730,8 @@ class MutableIntervalSet(
             return
 
         interval = atomic.Atomic.from_value(value)
-        self._intervals = SortedSet(self._union(FrozenIntervalSet([interval])))
+        if interval:
+            self._add(interval)
 
     def remove(self, value: atomic.IntervalValue[atomic.TO]) -> None:
         """
@@ -1591,7 +1772,7 @@ class MutableIntervalSet(
         interval = atomic.Atomic.from_value(value)
         index = self._bisect_left(interval)
         if index < len(self) and interval.during(self[index], strict=False):
-            self._intervals = SortedSet(self._intersection(~interval))
+            self._discard(interval, index)
         else:
             raise KeyError(f"{value}")
 
@@ -1625,7 +1806,8 @@ class MutableIntervalSet(
             return
 
         interval = atomic.Atomic.from_value(value)
-        self._intervals = SortedSet(self._intersection(~interval))
+        if interval:
+            self._discard(interval, self._intervals.bisect_key_left(interval.lower))
 
     def pop(self) -> atomic.Interval[atomic.TO]:
         """
@@ -1673,7 +1855,7 @@ class MutableIntervalSet(
             >>> print(a)
             <BLANKLINE>
         """
-        self._intervals = SortedSet()
+        self._intervals = self._sorted()
 
 
 if __name__ == "__main__":
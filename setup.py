@@ -72,6 +72,7 @@ setuptools.setup(
             "mypy",
             "black",
             "pytest-cov",
+            "pytest-xdist",
             "nose2",
         ],
         "build": ["setuptools_cythonize>=1.0"],
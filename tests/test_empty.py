@@ -3,7 +3,7 @@ import unittest
 from part import Empty, Interval, FrozenIntervalSet, Atomic
 
 
-class IntervalTestCase(unittest.TestCase):
+class EmptyTestCase(unittest.TestCase):
     def test___bool__(self):
         self.assertFalse(bool(Empty[int]()))
 
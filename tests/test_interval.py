@@ -1,4 +1,8 @@
+import copy
+import pickle
 import unittest
+from collections import namedtuple
+from decimal import Decimal
 
 from part import Empty, Interval, INFINITY, Atomic
 
@@ -46,10 +50,28 @@ class IntervalTestCase(unittest.TestCase):
         self.assertEqual(str(Atomic[int].from_tuple((0, 1, None))), "(0;1)")
         self.assertEqual(str(Atomic[int].from_tuple((0, 1, True, True))), "[0;1]")
         self.assertEqual(str(Atomic[int].from_tuple((0, 1, None, True))), "(0;1]")
+        self.assertIs(Atomic[int].from_tuple((0, 1)), Atomic[int].from_tuple((0, 1)))
+        a = Atomic[Decimal].from_tuple((Decimal("1"), Decimal("2")))
+        b = Atomic[Decimal].from_tuple((Decimal("1.00"), Decimal("2.00")))
+        self.assertIsNot(a, b)
+        self.assertEqual(str(b.lower_value), "1.00")
+        self.assertEqual(str(Atomic[float].from_tuple((0.0, 1.0))), "[0.0;1.0)")
+        self.assertEqual(str(Atomic[list].from_tuple(([0], [1]))), "[[0];[1])")
+        with self.assertRaises(TypeError):
+            Atomic[int].from_tuple((0, 1, None, True, True))
 
     def test_from_value(self):
         self.assertEqual(str(Atomic[int].from_value(1)), "[1;1]")
         self.assertEqual(str(Atomic[int].from_value(Empty[int]())), "")
+        a = Interval[int](1, 3)
+        self.assertIs(Atomic[int].from_value(a), a)
+        self.assertEqual(str(Atomic[int].from_value((1, 3, None))), "(1;3)")
+        self.assertEqual(str(Atomic[float].from_value(1.5)), "[1.5;1.5]")
+        self.assertEqual(str(Atomic[str].from_value("a")), "['a';'a']")
+        # Subclasses take the generic path
+        self.assertEqual(str(Atomic[int].from_value(True)), "[True;True]")
+        Pair = namedtuple("Pair", ["lower", "upper"])
+        self.assertEqual(str(Atomic[int].from_value(Pair(1, 3))), "[1;3)")
 
     def test_lower_limit(self):
         self.assertEqual(str(Interval[int].lower_limit(value=1)), "[1;+inf)")
@@ -68,6 +90,17 @@ class IntervalTestCase(unittest.TestCase):
 
     def test___hash__(self):
         self.assertEqual(hash(Interval[int]()), hash(Interval[int]()))
+        a = Interval[int](1, 2)
+        self.assertEqual(hash(a), hash(a))
+        self.assertEqual(hash(a), hash(Interval[int](1, 2)))
+
+    def test_pickle(self):
+        a = Interval[int](1, 2, upper_closed=True)
+        hash(a)
+        for b in (pickle.loads(pickle.dumps(a)), copy.copy(a), copy.deepcopy(a)):
+            self.assertEqual(str(b), "[1;2]")
+            self.assertEqual(b, a)
+            self.assertEqual(hash(b), hash(a))
 
     def test___eq__(self):
         self.assertTrue(
@@ -149,6 +182,13 @@ class IntervalTestCase(unittest.TestCase):
         self.assertEqual(str(Interval[int](1, 3) - Interval[int](2, 4)), "[1;2)")
         self.assertEqual(str(Interval[int](1, 2) - Interval[int](1, 4)), "")
         self.assertEqual(str(Interval[int](1, 3) - Empty[int]()), "[1;3)")
+        self.assertEqual(str(Interval[int](1, 3) - Interval[int](4, 5)), "[1;3)")
+        self.assertEqual(
+            str(Interval[int](1, 9) - Interval[int](3, 5, None, True)), "[1;3] | (5;9)"
+        )
+        self.assertEqual(
+            str(Interval[int](1, 9, True, True) - Interval[int](1, 9)), "[9;9]"
+        )
         with self.assertRaises(TypeError):
             Interval[int](1, 3) - None
 
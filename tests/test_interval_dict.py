@@ -1,6 +1,6 @@
 import unittest
 
-from part import FrozenIntervalDict, Empty
+from part import FrozenIntervalDict, MutableIntervalDict, Interval, Empty
 
 
 class IntervalDictTestCase(unittest.TestCase):
@@ -20,6 +20,17 @@ class IntervalDictTestCase(unittest.TestCase):
             hash(FrozenIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})),
         )
 
+    def test___eq__(self):
+        a = FrozenIntervalDict[int, int]({(10, 15): 1, (20, 25): 2})
+        self.assertEqual(a, MutableIntervalDict[int, int]({(20, 25): 2, (10, 15): 1}))
+        self.assertNotEqual(a, FrozenIntervalDict[int, int]({(10, 15): 1}))
+        self.assertNotEqual(a, FrozenIntervalDict[int, int]({(10, 15): 1, (20, 25): 3}))
+        self.assertEqual(a, {Interval(10, 15): 1, Interval(20, 25): 2})
+        self.assertNotEqual(a, None)
+        b = MutableIntervalDict[int, int](a)
+        b._intervals.remove(Interval(20, 25))
+        self.assertNotEqual(a, b)
+
     def test___iter__(self):
         self.assertEqual(
             list(
@@ -78,6 +89,60 @@ class IntervalDictTestCase(unittest.TestCase):
             ["[20;25)", "[30;35)", "[40;45)"],
         )
         self.assertEqual([str(interval) for interval in a.select(Empty[int]())], [])
+        self.assertEqual([str(interval) for interval in a.select((12, 12, None))], [])
+        b = MutableIntervalDict[int, int](a)
+        self.assertEqual(
+            [str(interval) for interval in b.select((12, 32), strict=False)],
+            ["[10;15)", "[20;25)", "[30;35)"],
+        )
+        self.assertEqual(
+            [str(interval) for interval in b.select((12, 32))], ["[20;25)"]
+        )
+
+    def test_gaps(self):
+        a = FrozenIntervalDict[int, int](
+            {(10, 15): 1, (20, 25): 2, (30, 35): 3, (40, 45): 3}
+        )
+        self.assertEqual(
+            [str(interval) for interval in a.gaps((22, 42))], ["[25;30)", "[35;40)"]
+        )
+        self.assertEqual(
+            [str(interval) for interval in a.gaps((None, 12))], ["(-inf;10)"]
+        )
+        self.assertEqual(
+            [str(interval) for interval in a.gaps((42, None))], ["[45;+inf)"]
+        )
+        self.assertEqual([str(interval) for interval in a.gaps((11, 14))], [])
+        self.assertEqual([str(interval) for interval in a.gaps(Empty[int]())], [])
+        b = MutableIntervalDict[int, int](a)
+        self.assertEqual(
+            [str(interval) for interval in b.gaps((12, 32, True, True))],
+            ["[15;20)", "[25;30)"],
+        )
+        self.assertEqual(
+            [str(interval) for interval in b.gaps((15, 20, None))], ["(15;20)"]
+        )
+        self.assertEqual(
+            [str(interval) for interval in MutableIntervalDict().gaps((1, 2))],
+            ["[1;2)"],
+        )
+
+    def test_as_canonical(self):
+        a = FrozenIntervalDict[int, int](
+            {(10, 15): 1, (20, 25, None): 2, (30, 35, True, True): 3}
+        )
+        self.assertEqual(
+            a.as_canonical(),
+            (
+                (10, 15, True, None, 1),
+                (20, 25, None, None, 2),
+                (30, 35, True, True, 3),
+            ),
+        )
+        self.assertEqual(
+            MutableIntervalDict[int, int](a).as_canonical(), a.as_canonical()
+        )
+        self.assertEqual(MutableIntervalDict[int, int]().as_canonical(), ())
 
     def test_compress(self):
         a = FrozenIntervalDict[int, int](
@@ -85,6 +150,9 @@ class IntervalDictTestCase(unittest.TestCase):
         )
         b = a.compress()
         self.assertEqual(str(b), "{'[10;25)': 1, '[30;45)': 2}")
+        self.assertEqual(
+            str(a), "{'[10;14)': 1, '[14;25)': 1, '[30;33)': 2, '[33;45)': 2}"
+        )
 
 
 if __name__ == "__main__":
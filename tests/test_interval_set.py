@@ -1,15 +1,28 @@
 import unittest
 
-from part import Atomic, Empty, Interval, FrozenIntervalSet
+from part import Atomic, Empty, Interval, FrozenIntervalSet, MutableIntervalSet
 
+FI = FrozenIntervalSet[int]
 
-class IntervalTestCase(unittest.TestCase):
+_I01 = Interval[int](0, 1)
+_I02 = Interval[int](0, 2)
+_I23 = Interval[int](2, 3)
+_I510 = Interval[int](5, 10)
+_I1323 = Interval[int](13, 23)
+_I2425 = Interval[int](24, 25)
+
+
+class IntervalSetTestCase(unittest.TestCase):
     def test___init__(self):
-        self.assertEqual(str(FrozenIntervalSet[int]()), "")
-        self.assertEqual(str(FrozenIntervalSet[int]([Empty[int]()])), "")
+        self.assertEqual(str(FI()), "")
+        self.assertEqual(str(FI([Empty[int]()])), "")
+        a = FI([_I510, _I01, _I02])
+        self.assertEqual(str(a), "[0;2) | [5;10)")
+        self.assertIs(a[1], _I510)
+        self.assertEqual(str(_I01), "[0;1)")
         self.assertEqual(
             str(
-                FrozenIntervalSet[int](
+                FI(
                     [
                         Interval[int](1, 2),
                         Interval[int](0, 1, upper_closed=True),
@@ -19,94 +32,86 @@ class IntervalTestCase(unittest.TestCase):
             "[0;2)",
         )
         self.assertEqual(
-            str(FrozenIntervalSet[int]([Interval[int](2, 3), Interval[int](0, 1)])),
+            str(FI([Interval[int](2, 3), Interval[int](0, 1)])),
             "[0;1) | [2;3)",
         )
-        self.assertEqual(str(FrozenIntervalSet[int]([(2, 3), (0, 1)])), "[0;1) | [2;3)")
-        self.assertEqual(
-            str(FrozenIntervalSet[int]([(2, 3), (0, 1), 1])), "[0;1] | [2;3)"
-        )
+        self.assertEqual(str(FI([(2, 3), (0, 1)])), "[0;1) | [2;3)")
+        self.assertEqual(str(FI([(2, 3), (0, 1), 1])), "[0;1] | [2;3)")
         self.assertEqual(
-            str(FrozenIntervalSet[int]([(2, 3), (0, 1, True, True)])),
+            str(FI([(2, 3), (0, 1, True, True)])),
             "[0;1] | [2;3)",
         )
-        self.assertEqual(
-            str(FrozenIntervalSet[int]([(2, 3, None), (0, 1)])), "[0;1) | (2;3)"
-        )
-        self.assertEqual(
-            str(FrozenIntervalSet[int]([(2, 3), (0, 1, None)])), "(0;1) | [" "2;3)"
-        )
-        self.assertEqual(
-            str(FrozenIntervalSet[int]([(2, 3), (0, 1), (1,)])), "[0;1] | [2;3)"
-        )
+        self.assertEqual(str(FI([(2, 3, None), (0, 1)])), "[0;1) | (2;3)")
+        self.assertEqual(str(FI([(2, 3), (0, 1, None)])), "(0;1) | [" "2;3)")
+        self.assertEqual(str(FI([(2, 3), (0, 1), (1,)])), "[0;1] | [2;3)")
         with self.assertRaises(TypeError):
-            FrozenIntervalSet[int]([(0, 1, 2, 3, 4)])
+            FI([(0, 1, 2, 3, 4)])
 
     def test___hash__(self):
         self.assertEqual(
-            hash(FrozenIntervalSet[int]([(2, 3), (0, 1), (1,)])),
-            hash(FrozenIntervalSet[int]([(2, 3), (0, 1), (1,)])),
+            hash(FI([(2, 3), (0, 1), (1,)])),
+            hash(FI([(2, 3), (0, 1), (1,)])),
         )
 
     def test___eq__(self):
-        a = FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
+        a = FI([(0, 2), (5, 10), (13, 23), (24, 25)])
         self.assertEqual(a, a)
-        self.assertNotEqual(a, FrozenIntervalSet[int]())
+        self.assertNotEqual(a, FI())
         self.assertNotEqual(a, None)
+        self.assertEqual(a, MutableIntervalSet[int](a))
+        self.assertEqual(MutableIntervalSet[int](a), a)
+        self.assertNotEqual(MutableIntervalSet[int](a[1:]), a)
 
     def test___le__(self):
-        a = FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
-        self.assertTrue(a <= FrozenIntervalSet[int]([(0, 30)]))
-        self.assertTrue(a <= FrozenIntervalSet[int]([(0, 11), (12, 30)]))
-        self.assertFalse(a <= FrozenIntervalSet[int]([(0, 9), (12, 30)]))
+        a = FI([(0, 2), (5, 10), (13, 23), (24, 25)])
+        self.assertTrue(a <= FI([(0, 30)]))
+        self.assertTrue(a <= FI([(0, 11), (12, 30)]))
+        self.assertFalse(a <= FI([(0, 9), (12, 30)]))
         self.assertTrue(a <= a)
         with self.assertRaises(TypeError):
             a <= None
 
     def test___lt__(self):
-        a = FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
-        self.assertTrue(a < FrozenIntervalSet[int]([(0, 30)]))
-        self.assertTrue(a < FrozenIntervalSet[int]([(0, 11), (12, 30)]))
-        self.assertFalse(a < FrozenIntervalSet[int]([(0, 9), (12, 30)]))
+        a = FI([(0, 2), (5, 10), (13, 23), (24, 25)])
+        self.assertTrue(a < FI([(0, 30)]))
+        self.assertTrue(a < FI([(0, 11), (12, 30)]))
+        self.assertFalse(a < FI([(0, 9), (12, 30)]))
         self.assertFalse(a < a)
         with self.assertRaises(TypeError):
             a < None
 
     def test___ge__(self):
-        a = FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
-        self.assertTrue(FrozenIntervalSet[int]([(0, 30)]) >= a)
-        self.assertTrue(FrozenIntervalSet[int]([(0, 11), (12, 30)]) >= a)
-        self.assertFalse(FrozenIntervalSet[int]([(0, 9), (12, 30)]) >= a)
+        a = FI([(0, 2), (5, 10), (13, 23), (24, 25)])
+        self.assertTrue(FI([(0, 30)]) >= a)
+        self.assertTrue(FI([(0, 11), (12, 30)]) >= a)
+        self.assertFalse(FI([(0, 9), (12, 30)]) >= a)
         self.assertTrue(a >= a)
         with self.assertRaises(TypeError):
             a >= None
 
     def test___gt__(self):
-        a = FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
-        self.assertTrue(FrozenIntervalSet[int]([(0, 30)]) > a)
-        self.assertTrue(FrozenIntervalSet[int]([(0, 11), (12, 30)]) > a)
-        self.assertFalse(FrozenIntervalSet[int]([(0, 9), (12, 30)]) > a)
+        a = FI([(0, 2), (5, 10), (13, 23), (24, 25)])
+        self.assertTrue(FI([(0, 30)]) > a)
+        self.assertTrue(FI([(0, 11), (12, 30)]) > a)
+        self.assertFalse(FI([(0, 9), (12, 30)]) > a)
         self.assertFalse(a > a)
         with self.assertRaises(TypeError):
             a > None
 
     def test___len__(self):
-        self.assertEqual(len(FrozenIntervalSet[int]([(2, 3), (0, 1)])), 2)
+        self.assertEqual(len(FI([(2, 3), (0, 1)])), 2)
 
     def test___bool__(self):
-        self.assertTrue(FrozenIntervalSet[int]([(2, 3), (0, 1)]))
-        self.assertFalse(FrozenIntervalSet[int]())
+        self.assertTrue(FI([(2, 3), (0, 1)]))
+        self.assertFalse(FI())
 
     def test___iter__(self):
-        self.assertEqual(
-            list(iter(FrozenIntervalSet[int]([(2, 3), (0, 1)]))),
-            [Interval[int](0, 1), Interval[int](2, 3)],
-        )
+        self.assertEqual(list(iter(FI([(2, 3), (0, 1)]))), [_I01, _I23])
 
     def test___contains__(self):
-        intervals = FrozenIntervalSet[int]([(2, 3), (0, 1)])
-        self.assertIn(Interval[int](0, 1), intervals)
-        self.assertIn(Interval[int](2, 3), intervals)
+        intervals = FI([(2, 3), (0, 1)])
+        self.assertIn(_I01, intervals)
+        self.assertIn(_I23, intervals)
         self.assertNotIn(Interval[int](4, 5), intervals)
         self.assertNotIn(Interval[int](1, 2), intervals)
         self.assertNotIn(Interval[int](2, 3, upper_closed=True), intervals)
@@ -115,235 +120,239 @@ class IntervalTestCase(unittest.TestCase):
         self.assertNotIn(Interval[int]("Hello", "World"), intervals)
 
     def test___getitem__(self):
-        intervals = FrozenIntervalSet[int]([(2, 3), (0, 1)])
-        self.assertEqual(intervals[0], Interval[int](0, 1))
-        self.assertEqual(intervals[1], Interval[int](2, 3))
-        self.assertEqual(intervals[1:], FrozenIntervalSet[int]([Interval[int](2, 3)]))
+        intervals = FI([(2, 3), (0, 1)])
+        self.assertEqual(intervals[0], _I01)
+        self.assertEqual(intervals[1], _I23)
+        self.assertEqual(intervals[1:], FI([_I23]))
         with self.assertRaises(IndexError):
             intervals[2]
 
     def test___and__(self):
         self.assertEqual(
-            str(
-                FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
-                & FrozenIntervalSet[int](
-                    [(1, 5, True, True), (8, 12), (15, 18), (20, 24, True, True)]
-                )
+            FI([(0, 2), (5, 10), (13, 23), (24, 25)])
+            & FI([(1, 5, True, True), (8, 12), (15, 18), (20, 24, True, True)]),
+            FI(
+                [
+                    (1, 2),
+                    (5, 5, True, True),
+                    (8, 10),
+                    (15, 18),
+                    (20, 23),
+                    (24, 24, True, True),
+                ]
             ),
-            "[1;2) | [5;5] | [8;10) | [15;18) | [20;23) | [24;24]",
         )
         with self.assertRaises(TypeError):
-            FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)]) & None
+            FI([(0, 2), (5, 10), (13, 23), (24, 25)]) & None
 
     def test___or__(self):
         self.assertEqual(
-            str(
-                FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
-                | FrozenIntervalSet[int](
-                    [(1, 5, True, True), (8, 12), (15, 18), (20, 24, True, True)]
-                )
-            ),
-            "[0;12) | [13;25)",
+            FI([(0, 2), (5, 10), (13, 23), (24, 25)])
+            | FI([(1, 5, True, True), (8, 12), (15, 18), (20, 24, True, True)]),
+            FI([(0, 12), (13, 25)]),
         )
         with self.assertRaises(TypeError):
-            FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)]) | None
+            FI([(0, 2), (5, 10), (13, 23), (24, 25)]) | None
 
     def test___invert__(self):
         self.assertEqual(
-            str(~FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])),
+            str(~FI([(0, 2), (5, 10), (13, 23), (24, 25)])),
             "(-inf;0) | [2;5) | [10;13) | [23;24) | [25;+inf)",
         )
-        self.assertEqual(str(~FrozenIntervalSet[int]()), "(-inf;+inf)")
-        self.assertEqual(str(~~FrozenIntervalSet[int]()), "")
-        self.assertEqual(str(~~~FrozenIntervalSet[int]()), "(-inf;+inf)")
+        self.assertEqual(str(~FI()), "(-inf;+inf)")
+        self.assertEqual(str(~~FI()), "")
+        self.assertEqual(str(~~~FI()), "(-inf;+inf)")
 
     def test___sub__(self):
-        a = FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
+        a = FI([(0, 2), (5, 10), (13, 23), (24, 25)])
         self.assertEqual(
-            str(a - FrozenIntervalSet[int]([(0, 6), (9, 12), (24, 30, None)])),
-            "[6;9) | [13;23) | [24;24]",
+            a - FI([(0, 6), (9, 12), (24, 30, None)]),
+            FI([(6, 9), (13, 23), (24, 24, True, True)]),
         )
         with self.assertRaises(TypeError):
             a - None
 
     def test___xor__(self):
-        a = FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
+        a = FI([(0, 2), (5, 10), (13, 23), (24, 25)])
         self.assertEqual(
-            str(a ^ FrozenIntervalSet[int]([(0, 6), (9, 12), (24, 30, None)])),
-            "[2;5) | [6;9) | [10;12) | [13;23) | [24;24] | [25;30)",
+            a ^ FI([(0, 6), (9, 12), (24, 30, None)]),
+            FI([(2, 5), (6, 9), (10, 12), (13, 23), (24, 24, True, True), (25, 30)]),
         )
         with self.assertRaises(TypeError):
             a ^ None
 
     def test_intersection(self):
-        a = FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
+        a = FI([(0, 2), (5, 10), (13, 23), (24, 25)])
         self.assertEqual(
-            str(
-                a.intersection(
-                    FrozenIntervalSet[int](
-                        [(1, 5, True, True), (8, 12), (15, 18), (20, 24, True, True)]
-                    ),
-                    FrozenIntervalSet[int]([(1, 9), (16, 30)]),
-                )
+            a.intersection(
+                FI([(1, 5, True, True), (8, 12), (15, 18), (20, 24, True, True)]),
+                FI([(1, 9), (16, 30)]),
+            ),
+            FI(
+                [
+                    (1, 2),
+                    (5, 5, True, True),
+                    (8, 9),
+                    (16, 18),
+                    (20, 23),
+                    (24, 24, True, True),
+                ]
             ),
-            "[1;2) | [5;5] | [8;9) | [16;18) | [20;23) | [24;24]",
-        )
-        self.assertEqual(str(a.intersection(FrozenIntervalSet[int]())), "")
-        self.assertEqual(str(a.intersection(FrozenIntervalSet[int]([(-1, 0)]))), "")
-        self.assertEqual(str(a.intersection(FrozenIntervalSet[int]([(1, 2)]))), "[1;2)")
-        self.assertEqual(str(a.intersection(FrozenIntervalSet[int]([(11, 12)]))), "")
-        self.assertEqual(
-            str(a.intersection(FrozenIntervalSet[int]([(17, 24)]))), "[17;23)"
-        )
-        self.assertEqual(
-            str(a.intersection(FrozenIntervalSet[int]([(24, 25)]))), "[24;25)"
         )
-        self.assertEqual(str(a.intersection(FrozenIntervalSet[int]([(30, 31)]))), "")
+        equal = self.assertEqual
+        intersection = a.intersection
+        for other, expected in (
+            ([], []),
+            ([(-1, 0)], []),
+            ([(1, 2)], [(1, 2)]),
+            ([(11, 12)], []),
+            ([(17, 24)], [(17, 23)]),
+            ([(24, 25)], [(24, 25)]),
+            ([(30, 31)], []),
+        ):
+            with self.subTest(other=other):
+                equal(intersection(FI(other)), FI(expected))
         self.assertEqual(
-            str(a.intersection([(6, 9)], [(6, 7), (8, 9)])), "[6;7) | [8;9)"
+            a.intersection([(6, 9)], [(6, 7), (8, 9)]), FI([(6, 7), (8, 9)])
         )
-        self.assertEqual(str(FrozenIntervalSet[int]().intersection()), "")
+        self.assertEqual(FI().intersection(), FI())
 
         with self.assertRaises(TypeError):
-            FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)]).intersection(
-                None
-            )
+            FI([(0, 2), (5, 10), (13, 23), (24, 25)]).intersection(None)
 
         with self.assertRaises(TypeError):
-            FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)]).intersection(
-                1
-            )
+            FI([(0, 2), (5, 10), (13, 23), (24, 25)]).intersection(1)
 
     def test_union(self):
-        a = FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
+        a = FI([(0, 2), (5, 10), (13, 23), (24, 25)])
         self.assertEqual(
-            str(
-                a.union(
-                    FrozenIntervalSet[int](
-                        [(1, 5, True, True), (8, 12), (15, 18), (20, 24, True, True)]
-                    ),
-                    FrozenIntervalSet[int]([(1, 9), (16, 30)]),
-                )
+            a.union(
+                FI([(1, 5, True, True), (8, 12), (15, 18), (20, 24, True, True)]),
+                FI([(1, 9), (16, 30)]),
             ),
-            "[0;12) | [13;30)",
-        )
-        self.assertEqual(
-            str(a.union(FrozenIntervalSet[int]())),
-            "[0;2) | [5;10) | [13;23) | [24;25)",
-        )
-        self.assertEqual(
-            str(a.union(FrozenIntervalSet[int]([(-1, 0)]))),
-            "[-1;2) | [5;10) | [13;23) | [24;25)",
-        )
-        self.assertEqual(
-            str(a.union(FrozenIntervalSet[int]([(1, 2)]))),
-            "[0;2) | [5;10) | [13;23) | [24;25)",
-        )
-        self.assertEqual(
-            str(a.union(FrozenIntervalSet[int]([(11, 12)]))),
-            "[0;2) | [5;10) | [11;12) | [13;23) | [24;25)",
-        )
-        self.assertEqual(
-            str(a.union(FrozenIntervalSet[int]([(17, 24)]))),
-            "[0;2) | [5;10) | [13;25)",
-        )
-        self.assertEqual(
-            str(a.union(FrozenIntervalSet[int]([(24, 25)]))),
-            "[0;2) | [5;10) | [13;23) | [24;25)",
-        )
-        self.assertEqual(
-            str(a.union(FrozenIntervalSet[int]([(30, 31)]))),
-            "[0;2) | [5;10) | [13;23) | [24;25) | [30;31)",
-        )
-        self.assertEqual(
-            str(a.union([(6, 9)], [(6, 7), (8, 9)])),
-            "[0;2) | [5;10) | [13;23) | [24;25)",
-        )
-        self.assertEqual(str(FrozenIntervalSet[int]().union()), "")
-
-        self.assertEqual(str(a.union([(2, 5)], [(10, 13), (23, 24)])), "[0;25)")
+            FI([(0, 12), (13, 30)]),
+        )
+        equal = self.assertEqual
+        union = a.union
+        for other, expected in (
+            ([], a),
+            ([(-1, 0)], FI([(-1, 2), (5, 10), (13, 23), (24, 25)])),
+            ([(1, 2)], a),
+            ([(11, 12)], FI([(0, 2), (5, 10), (11, 12), (13, 23), (24, 25)])),
+            ([(17, 24)], FI([(0, 2), (5, 10), (13, 25)])),
+            ([(24, 25)], a),
+            ([(30, 31)], FI([(0, 2), (5, 10), (13, 23), (24, 25), (30, 31)])),
+        ):
+            with self.subTest(other=other):
+                equal(union(FI(other)), expected)
+        self.assertEqual(a.union([(6, 9)], [(6, 7), (8, 9)]), a)
+        self.assertEqual(FI().union(), FI())
+
+        self.assertEqual(a.union([(2, 5)], [(10, 13), (23, 24)]), FI([(0, 25)]))
 
         with self.assertRaises(TypeError):
-            FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)]).union(None)
+            FI([(0, 2), (5, 10), (13, 23), (24, 25)]).union(None)
 
         with self.assertRaises(TypeError):
-            FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)]).union(1)
+            FI([(0, 2), (5, 10), (13, 23), (24, 25)]).union(1)
+
+    def test_union_unbounded(self):
+        self.assertEqual(FI().union([(None, 3)]), FI([(None, 3)]))
+        self.assertEqual(FI([(None, 3)]).union([(5, 8)]), FI([(None, 3), (5, 8)]))
+        self.assertEqual(FI([(None, 3)]) - FI([(None, 5)]), FI())
+        self.assertEqual(FI([(None, 5)]) - FI([(None, 3)]), FI([(3, 5)]))
 
     def test_isdisjoint(self):
-        a = FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
-        self.assertTrue(a.isdisjoint(FrozenIntervalSet[int]()))
-        self.assertTrue(a.isdisjoint(FrozenIntervalSet[int]([(-1, 0)])))
-        self.assertFalse(a.isdisjoint(FrozenIntervalSet[int]([(1, 2)])))
-        self.assertTrue(a.isdisjoint(FrozenIntervalSet[int]([(11, 12)])))
-        self.assertFalse(a.isdisjoint(FrozenIntervalSet[int]([(17, 24)])))
-        self.assertFalse(a.isdisjoint(FrozenIntervalSet[int]([(24, 25)])))
-        self.assertTrue(a.isdisjoint(FrozenIntervalSet[int]([(30, 31)])))
+        a = FI([(0, 2), (5, 10), (13, 23), (24, 25)])
+        equal = self.assertEqual
+        isdisjoint = a.isdisjoint
+        for other, expected in (
+            ([], True),
+            ([(-1, 0)], True),
+            ([(1, 2)], False),
+            ([(11, 12)], True),
+            ([(17, 24)], False),
+            ([(24, 25)], False),
+            ([(30, 31)], True),
+        ):
+            with self.subTest(other=other):
+                equal(isdisjoint(FI(other)), expected)
 
     def test_issubset(self):
-        a = FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
+        a = FI([(0, 2), (5, 10), (13, 23), (24, 25)])
         self.assertTrue(a.issubset([(0, 30)]))
-        self.assertTrue(a.issubset(FrozenIntervalSet[int]([(0, 30)])))
-        self.assertTrue(a.issubset(FrozenIntervalSet[int]([(0, 11), (12, 30)])))
-        self.assertFalse(a.issubset(FrozenIntervalSet[int]([(0, 9), (12, 30)])))
+        self.assertTrue(a.issubset(FI([(0, 30)])))
+        self.assertTrue(a.issubset(FI([(0, 11), (12, 30)])))
+        self.assertFalse(a.issubset(FI([(0, 9), (12, 30)])))
         self.assertTrue(a.issubset(a))
 
     def test_issuperset(self):
-        a = FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
+        a = FI([(0, 2), (5, 10), (13, 23), (24, 25)])
         self.assertFalse(a.issuperset([(0, 30)]))
-        self.assertFalse(a.issuperset(FrozenIntervalSet[int]([(0, 30)])))
-        self.assertFalse(a.issuperset(FrozenIntervalSet[int]([(0, 11), (12, 30)])))
-        self.assertFalse(a.issuperset(FrozenIntervalSet[int]([(0, 9), (12, 30)])))
+        self.assertFalse(a.issuperset(FI([(0, 30)])))
+        self.assertFalse(a.issuperset(FI([(0, 11), (12, 30)])))
+        self.assertFalse(a.issuperset(FI([(0, 9), (12, 30)])))
         self.assertTrue(a.issuperset(a))
 
     def test_difference(self):
-        a = FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
+        a = FI([(0, 2), (5, 10), (13, 23), (24, 25)])
         self.assertEqual(
-            str(
-                a.difference(FrozenIntervalSet[int]([(0, 6), (9, 12), (24, 30, None)]))
-            ),
-            "[6;9) | [13;23) | [24;24]",
+            a.difference(FI([(0, 6), (9, 12), (24, 30, None)])),
+            FI([(6, 9), (13, 23), (24, 24, True, True)]),
         )
 
     def test_symmetric_difference(self):
-        a = FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
+        a = FI([(0, 2), (5, 10), (13, 23), (24, 25)])
         self.assertEqual(
-            str(a.symmetric_difference([(0, 6), (9, 12), (24, 30, None)])),
-            "[2;5) | [6;9) | [10;12) | [13;23) | [24;24] | [25;30)",
+            a.symmetric_difference([(0, 6), (9, 12), (24, 30, None)]),
+            FI([(2, 5), (6, 9), (10, 12), (13, 23), (24, 24, True, True), (25, 30)]),
         )
 
     def test_copy(self):
-        a = FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
+        a = FI([(0, 2), (5, 10), (13, 23), (24, 25)])
         self.assertEqual(a, a.copy())
         self.assertNotEqual(id(a), id(a.copy()))
 
     def test_select(self):
-        a = FrozenIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
-        self.assertEqual(list(iter(a.select((1, 14)))), [Interval[int](5, 10)])
+        a = FI([(0, 2), (5, 10), (13, 23), (24, 25)])
+        self.assertEqual(list(a.select((1, 14))), [_I510])
+        self.assertEqual(list(a.select((1, 14), strict=False)), [_I02, _I510, _I1323])
+        self.assertEqual(list(a.select(Empty[int]())), [])
+        self.assertEqual(list(a.select((24, 31, None))), [])
+        self.assertEqual(list(a.select((30, 31))), [])
+        self.assertEqual(list(a.select((-1, 1))), [])
+        self.assertEqual(list(a.select((-1, 0))), [])
+        self.assertEqual(list(a.select((24, 31, None), strict=False)), [_I2425])
+        self.assertEqual(list(a.select((30, 31), strict=False)), [])
+        self.assertEqual(list(a.select((-1, 1), strict=False)), [_I02])
+        self.assertEqual(list(a.select((-1, 0), strict=False)), [])
+        self.assertEqual(list(a.select((3, 3, None))), [])
+        b = MutableIntervalSet[int](a)
+        self.assertEqual(list(b.select((1, 24))), [_I510, _I1323])
         self.assertEqual(
-            list(iter(a.select((1, 14), strict=False))),
-            [
-                Interval[int](0, 2),
-                Interval[int](5, 10),
-                Interval[int](13, 23),
-            ],
+            list(b.select((1, 24, True, True), strict=False)),
+            [_I02, _I510, _I1323, _I2425],
         )
-        self.assertEqual(list(iter(a.select(Empty[int]()))), [])
-        self.assertEqual(list(iter(a.select((24, 31, None)))), [])
-        self.assertEqual(list(iter(a.select((30, 31)))), [])
-        self.assertEqual(list(iter(a.select((-1, 1)))), [])
-        self.assertEqual(list(iter(a.select((-1, 0)))), [])
+
+    def test_gaps(self):
+        a = FI([(0, 2), (5, 10), (13, 23), (24, 25)])
         self.assertEqual(
-            list(iter(a.select((24, 31, None), strict=False))),
-            [Interval[int](24, 25)],
+            [str(interval) for interval in a.gaps((1, 14))], ["[2;5)", "[10;13)"]
         )
-        self.assertEqual(list(iter(a.select((30, 31), strict=False))), [])
         self.assertEqual(
-            list(iter(a.select((-1, 1), strict=False))), [Interval[int](0, 2)]
+            [str(interval) for interval in a.gaps((None, 1))], ["(-inf;0)"]
         )
-        self.assertEqual(list(iter(a.select((-1, 0), strict=False))), [])
-
-    def test_reversed(self):
         self.assertEqual(
-            list(reversed(FrozenIntervalSet[int]([(2, 3), (0, 1)]))),
-            [Interval[int](2, 3), Interval[int](0, 1)],
+            [str(interval) for interval in a.gaps((23, None, None))],
+            ["(23;24)", "[25;+inf)"],
+        )
+        self.assertEqual(list(a.gaps((5, 10))), [])
+        self.assertEqual(list(a.gaps(Empty[int]())), [])
+        self.assertEqual(
+            [str(interval) for interval in MutableIntervalSet[int](a).gaps((1, 14))],
+            ["[2;5)", "[10;13)"],
         )
+        self.assertEqual(list(FI().gaps((1, 14))), [Interval[int](1, 14)])
+
+    def test_reversed(self):
+        self.assertEqual(list(reversed(FI([(2, 3), (0, 1)]))), [_I23, _I01])
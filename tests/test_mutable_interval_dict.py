@@ -1,555 +1,504 @@
 import unittest
 import operator
+from types import MappingProxyType
 
-from sortedcontainers import SortedSet
+from sortedcontainers import SortedList
 
 from part import MutableIntervalDict, FrozenIntervalSet, Interval, Atomic
 
-
+_MARKER = 1000
+_SEED = MappingProxyType({(10, 15): 1, (20, 25): 2, (30, 35): 3})
+_I110 = Interval(1, 10)
+_I520 = Interval(5, 20)
+_I1030 = Interval(10, 30)
+
+_V0 = frozenset({0})
+_V1 = frozenset({1})
+_V2 = frozenset({2})
+_V3 = frozenset({3})
+_V4 = frozenset({4})
+_V5 = frozenset({5})
+_V6 = frozenset({6})
+
+_ONE = MutableIntervalDict[int, frozenset]({(1, 10): _V1})
+_TWO = MutableIntervalDict[int, frozenset](
+    {(1, 5): _V1, (5, 10): frozenset({1, 2}), (10, 20): _V2}
+)
+_THREE = MutableIntervalDict[int, frozenset](
+    {
+        (1, 5): _V1,
+        (5, 10): frozenset({1, 2}),
+        (10, 20): frozenset({1, 2}),
+        (20, 30): _V1,
+    }
+)
+_COMPRESSED = MutableIntervalDict[int, frozenset](
+    {(1, 5): _V1, (5, 20): frozenset({1, 2}), (20, 30): _V1}
+)
+_SPREAD = MutableIntervalDict[int, frozenset](
+    {
+        (0, 10): frozenset({1, 2, 3}),
+        (10, 20): frozenset({1, 2, 3, 4}),
+        (20, 30): frozenset({1, 2, 3}),
+        (30, 40): _V3,
+        (40, 50): frozenset({3, 5}),
+        (50, 60): _V5,
+        (70, 80): _V6,
+    }
+)
+_SUMS = MutableIntervalDict[int, int]({(1, 5): 1, (5, 10): 3, (10, 20): 5, (20, 30): 3})
+
+SET_CASES = tuple(
+    (bounds, MutableIntervalDict[int, int](expected))
+    for bounds, expected in (
+        ((1, 1), _SEED),
+        ((11, 11), _SEED),
+        ((14, 12), _SEED),
+        ((1, 7), {(1, 7): _MARKER, (10, 15): 1, (20, 25): 2, (30, 35): 3}),
+        ((1, 12), {(1, 12): _MARKER, (12, 15): 1, (20, 25): 2, (30, 35): 3}),
+        ((1, 17), {(1, 17): _MARKER, (20, 25): 2, (30, 35): 3}),
+        ((1, 22), {(1, 22): _MARKER, (22, 25): 2, (30, 35): 3}),
+        ((1, 27), {(1, 27): _MARKER, (30, 35): 3}),
+        ((1, 32), {(1, 32): _MARKER, (32, 35): 3}),
+        ((1, 42), {(1, 42): _MARKER}),
+        (
+            (11, 12),
+            {(10, 11): 1, (11, 12): _MARKER, (12, 15): 1, (20, 25): 2, (30, 35): 3},
+        ),
+        ((11, 17), {(10, 11): 1, (11, 17): _MARKER, (20, 25): 2, (30, 35): 3}),
+        ((11, 22), {(10, 11): 1, (11, 22): _MARKER, (22, 25): 2, (30, 35): 3}),
+        ((11, 27), {(10, 11): 1, (11, 27): _MARKER, (30, 35): 3}),
+        ((11, 32), {(10, 11): 1, (11, 32): _MARKER, (32, 35): 3}),
+        ((11, 42), {(10, 11): 1, (11, 42): _MARKER}),
+        ((16, 17), {(10, 15): 1, (16, 17): _MARKER, (20, 25): 2, (30, 35): 3}),
+        ((16, 22), {(10, 15): 1, (16, 22): _MARKER, (22, 25): 2, (30, 35): 3}),
+        ((16, 27), {(10, 15): 1, (16, 27): _MARKER, (30, 35): 3}),
+        ((16, 32), {(10, 15): 1, (16, 32): _MARKER, (32, 35): 3}),
+        ((16, 42), {(10, 15): 1, (16, 42): _MARKER}),
+        (
+            (21, 22),
+            {(10, 15): 1, (20, 21): 2, (21, 22): _MARKER, (22, 25): 2, (30, 35): 3},
+        ),
+        ((21, 27), {(10, 15): 1, (20, 21): 2, (21, 27): _MARKER, (30, 35): 3}),
+        ((21, 32), {(10, 15): 1, (20, 21): 2, (21, 32): _MARKER, (32, 35): 3}),
+        ((21, 42), {(10, 15): 1, (20, 21): 2, (21, 42): _MARKER}),
+        ((26, 27), {(10, 15): 1, (20, 25): 2, (26, 27): _MARKER, (30, 35): 3}),
+        ((26, 32), {(10, 15): 1, (20, 25): 2, (26, 32): _MARKER, (32, 35): 3}),
+        ((26, 42), {(10, 15): 1, (20, 25): 2, (26, 42): _MARKER}),
+        (
+            (31, 32),
+            {(10, 15): 1, (20, 25): 2, (30, 31): 3, (31, 32): _MARKER, (32, 35): 3},
+        ),
+        ((31, 42), {(10, 15): 1, (20, 25): 2, (30, 31): 3, (31, 42): _MARKER}),
+        ((36, 42), {(10, 15): 1, (20, 25): 2, (30, 35): 3, (36, 42): _MARKER}),
+    )
+)
+
+DEL_CASES = tuple(
+    (bounds, MutableIntervalDict[int, int](expected))
+    for bounds, expected in (
+        ((1, 1), _SEED),
+        ((11, 11), _SEED),
+        ((14, 12), _SEED),
+        ((1, 7), _SEED),
+        ((1, 12), {(12, 15): 1, (20, 25): 2, (30, 35): 3}),
+        ((1, 17), {(20, 25): 2, (30, 35): 3}),
+        ((1, 22), {(22, 25): 2, (30, 35): 3}),
+        ((1, 27), {(30, 35): 3}),
+        ((1, 32), {(32, 35): 3}),
+        ((1, 42), {}),
+        ((11, 12), {(10, 11): 1, (12, 15): 1, (20, 25): 2, (30, 35): 3}),
+        ((11, 17), {(10, 11): 1, (20, 25): 2, (30, 35): 3}),
+        ((11, 22), {(10, 11): 1, (22, 25): 2, (30, 35): 3}),
+        ((11, 27), {(10, 11): 1, (30, 35): 3}),
+        ((11, 32), {(10, 11): 1, (32, 35): 3}),
+        ((11, 42), {(10, 11): 1}),
+        ((16, 17), _SEED),
+        ((16, 22), {(10, 15): 1, (22, 25): 2, (30, 35): 3}),
+        ((16, 27), {(10, 15): 1, (30, 35): 3}),
+        ((16, 32), {(10, 15): 1, (32, 35): 3}),
+        ((16, 42), {(10, 15): 1}),
+        ((21, 22), {(10, 15): 1, (20, 21): 2, (22, 25): 2, (30, 35): 3}),
+        ((21, 27), {(10, 15): 1, (20, 21): 2, (30, 35): 3}),
+        ((21, 32), {(10, 15): 1, (20, 21): 2, (32, 35): 3}),
+        ((21, 42), {(10, 15): 1, (20, 21): 2}),
+        ((26, 27), _SEED),
+        ((26, 32), {(10, 15): 1, (20, 25): 2, (32, 35): 3}),
+        ((26, 42), {(10, 15): 1, (20, 25): 2}),
+        ((31, 32), {(10, 15): 1, (20, 25): 2, (30, 31): 3, (32, 35): 3}),
+        ((31, 42), {(10, 15): 1, (20, 25): 2, (30, 31): 3}),
+        ((36, 42), _SEED),
+    )
+)
+
+STOP_CASES = tuple(
+    (bounds, MutableIntervalDict[int, int](expected))
+    for bounds, expected in (
+        ((11, 35), {(10, 11): 1, (35,): 3}),
+        ((21, 35), {(10, 15): 1, (20, 21): 2, (35,): 3}),
+        ((31, 35), {(10, 15): 1, (20, 25): 2, (30, 31): 3, (35,): 3}),
+    )
+)
+
+
+def _set_case(lower, upper, expected):
+    def test(self):
+        a = self._BASE.copy()
+        a[lower:upper] = _MARKER
+        self.assertEqual(a, expected)
+
+    return test
+
+
+def _del_case(lower, upper, expected):
+    def test(self):
+        a = self._BASE.copy()
+        del a[lower:upper]
+        self.assertEqual(a, expected)
+
+    return test
+
+
+def _expand_cases(cls):
+    # One method per case so that the runner (pytest -n) can distribute them
+    for (lower, upper), expected in SET_CASES:
+        name = f"test___setitem___{lower}_{upper}"
+        setattr(cls, name, _set_case(lower, upper, expected))
+    for (lower, upper), expected in DEL_CASES:
+        name = f"test___delitem___{lower}_{upper}"
+        setattr(cls, name, _del_case(lower, upper, expected))
+    return cls
+
+
+@_expand_cases
 class MutableIntervalDictTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._BASE = MutableIntervalDict[int, int](_SEED)
+
+    def setUp(self):
+        self.addTypeEqualityFunc(MutableIntervalDict, self._assert_dict_equal)
+
+    def _assert_dict_equal(self, first, second, msg=None):
+        # The ordered items are compared as well, so that each sorted interval is
+        # looked up through the public API. The dicts are only formatted when they
+        # differ.
+        if first != second or list(first.items()) != list(second.items()):
+            self.fail(self._formatMessage(msg, f"{first} != {second}"))
+
     def test___init__(self):
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
+        a = MutableIntervalDict[int, int](_SEED)
         self.assertEqual(str(a), "{'[10;15)': 1, '[20;25)': 2, '[30;35)': 3}")
 
         a = MutableIntervalDict[int, int](
-            {(10, 15): 1, (20, 25): 2, (30, 35): 3},
+            _SEED,
             operator=lambda x, y: x + y,
             strict=False,
         )
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;25)': 2, '[30;35)': 3}")
+        self.assertEqual(a, self._BASE)
 
         a = MutableIntervalDict[int, int](
             [((10, 15), 1), ((20, 25), 2), ((30, 35), 3)],
             operator=lambda x, y: x + y,
             strict=False,
         )
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;25)': 2, '[30;35)': 3}")
+        self.assertEqual(a, self._BASE)
 
         b = MutableIntervalDict(a, operator=lambda x, y: x + y, strict=False)
-        self.assertEqual(str(b), "{'[10;15)': 1, '[20;25)': 2, '[30;35)': 3}")
-
-        with self.assertRaises(TypeError):
-            _ = MutableIntervalDict[int, int](1)
-
-    def test___setitem__(self):
-        # Empty case
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-
-        a[1:1] = 1000
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;25)': 2, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[11:11] = 1000
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;25)': 2, '[30;35)': 3}")
-
-        # From 1
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[1:7] = 1000
-        self.assertEqual(
-            str(a), "{'[1;7)': 1000, '[10;15)': 1, '[20;25)': 2, '[30;35)': 3}"
-        )
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[1:12] = 1000
-        self.assertEqual(
-            str(a), "{'[1;12)': 1000, '[12;15)': 1, '[20;25)': 2, '[30;35)': 3}"
-        )
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[1:17] = 1000
-        self.assertEqual(str(a), "{'[1;17)': 1000, '[20;25)': 2, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[1:22] = 1000
-        self.assertEqual(str(a), "{'[1;22)': 1000, '[22;25)': 2, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[1:27] = 1000
-        self.assertEqual(str(a), "{'[1;27)': 1000, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[1:32] = 1000
-        self.assertEqual(str(a), "{'[1;32)': 1000, '[32;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[1:42] = 1000
-        self.assertEqual(str(a), "{'[1;42)': 1000}")
-
-        # From 11
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[11:12] = 1000
-        self.assertEqual(
-            str(a),
-            "{'[10;11)': 1, '[11;12)': 1000, '[12;15)': 1, '[20;25)': 2, '[30;35)': 3}",
-        )
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[11:17] = 1000
-        self.assertEqual(
-            str(a), "{'[10;11)': 1, '[11;17)': 1000, '[20;25)': 2, '[30;35)': 3}"
-        )
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[11:22] = 1000
-        self.assertEqual(
-            str(a), "{'[10;11)': 1, '[11;22)': 1000, '[22;25)': 2, '[30;35)': 3}"
-        )
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[11:27] = 1000
-        self.assertEqual(str(a), "{'[10;11)': 1, '[11;27)': 1000, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[11:32] = 1000
-        self.assertEqual(str(a), "{'[10;11)': 1, '[11;32)': 1000, '[32;35)': 3}")
+        self.assertEqual(b, self._BASE)
 
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[11:42] = 1000
-        self.assertEqual(str(a), "{'[10;11)': 1, '[11;42)': 1000}")
-
-        # From 16
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[16:17] = 1000
-        self.assertEqual(
-            str(a), "{'[10;15)': 1, '[16;17)': 1000, '[20;25)': 2, '[30;35)': 3}"
-        )
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[16:22] = 1000
-        self.assertEqual(
-            str(a), "{'[10;15)': 1, '[16;22)': 1000, '[22;25)': 2, '[30;35)': 3}"
-        )
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[16:27] = 1000
-        self.assertEqual(str(a), "{'[10;15)': 1, '[16;27)': 1000, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[16:32] = 1000
-        self.assertEqual(str(a), "{'[10;15)': 1, '[16;32)': 1000, '[32;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[16:42] = 1000
-        self.assertEqual(str(a), "{'[10;15)': 1, '[16;42)': 1000}")
-
-        # From 21
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[21:22] = 1000
-        self.assertEqual(
-            str(a),
-            "{'[10;15)': 1, '[20;21)': 2, '[21;22)': 1000, '[22;25)': 2, '[30;35)': 3}",
-        )
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[21:27] = 1000
-        self.assertEqual(
-            str(a), "{'[10;15)': 1, '[20;21)': 2, '[21;27)': 1000, '[30;35)': 3}"
-        )
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[21:32] = 1000
-        self.assertEqual(
-            str(a), "{'[10;15)': 1, '[20;21)': 2, '[21;32)': 1000, '[32;35)': 3}"
-        )
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[21:42] = 1000
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;21)': 2, '[21;42)': 1000}")
-
-        # From 26
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[26:27] = 1000
-        self.assertEqual(
-            str(a), "{'[10;15)': 1, '[20;25)': 2, '[26;27)': 1000, '[30;35)': 3}"
+        a = MutableIntervalDict[int, int](
+            [((30, 35), 3), ((10, 15), 1), ((20, 25), 2), ((14, 14), 0)]
         )
+        self.assertEqual(a, MutableIntervalDict[int, int](_SEED))
 
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[26:32] = 1000
+        a = MutableIntervalDict[int, int]([((10, 30), 1), ((20, 25), 2)])
         self.assertEqual(
-            str(a), "{'[10;15)': 1, '[20;25)': 2, '[26;32)': 1000, '[32;35)': 3}"
+            a, MutableIntervalDict[int, int]({(10, 20): 1, (20, 25): 2, (25, 30): 1})
         )
 
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[26:42] = 1000
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;25)': 2, '[26;42)': 1000}")
-
-        # From 31
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[31:32] = 1000
-        self.assertEqual(
-            str(a),
-            "{'[10;15)': 1, '[20;25)': 2, '[30;31)': 3, '[31;32)': 1000, '[32;35)': 3}",
-        )
+        with self.assertRaises(TypeError):
+            _ = MutableIntervalDict[int, int](1)
 
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[31:42] = 1000
+    def test___getitem__(self):
+        a = self._BASE.copy()
+        self.assertEqual(a[22], 2)
+        b = a[12:22]
+        self.assertEqual(b, MutableIntervalDict[int, int]({(12, 15): 1, (20, 22): 2}))
+        self.assertIsInstance(b._intervals, SortedList)
+        b[13:21] = 4
         self.assertEqual(
-            str(a), "{'[10;15)': 1, '[20;25)': 2, '[30;31)': 3, '[31;42)': 1000}"
+            b, MutableIntervalDict[int, int]({(12, 13): 1, (13, 21): 4, (21, 22): 2})
         )
 
-        # From 36
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        a[36:42] = 1000
-        self.assertEqual(
-            str(a), "{'[10;15)': 1, '[20;25)': 2, '[30;35)': 3, '[36;42)': 1000}"
-        )
+    def test___setitem__(self):
+        a = self._BASE.copy()
+        with self.assertRaises(ValueError):
+            a[11:11:2] = _MARKER
+        with self.assertRaises(ValueError):
+            del a[11:11:2]
 
     def test___delitem__(self):
-        # Empty case
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[1:1]
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;25)': 2, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[11:11]
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;25)': 2, '[30;35)': 3}")
-
-        # From 1
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[1:7]
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;25)': 2, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[1:12]
-        self.assertEqual(str(a), "{'[12;15)': 1, '[20;25)': 2, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[1:17]
-        self.assertEqual(str(a), "{'[20;25)': 2, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[1:22]
-        self.assertEqual(str(a), "{'[22;25)': 2, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[1:27]
-        self.assertEqual(str(a), "{'[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[1:32]
-        self.assertEqual(str(a), "{'[32;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[1:42]
-        self.assertEqual(str(a), "{}")
-
-        # From 11
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[11:12]
-        self.assertEqual(
-            str(a), "{'[10;11)': 1, '[12;15)': 1, '[20;25)': 2, '[30;35)': 3}"
-        )
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[11:17]
-        self.assertEqual(str(a), "{'[10;11)': 1, '[20;25)': 2, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[11:22]
-        self.assertEqual(str(a), "{'[10;11)': 1, '[22;25)': 2, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[11:27]
-        self.assertEqual(str(a), "{'[10;11)': 1, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[11:32]
-        self.assertEqual(str(a), "{'[10;11)': 1, '[32;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[11:42]
-        self.assertEqual(str(a), "{'[10;11)': 1}")
-
-        # From 16
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[16:17]
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;25)': 2, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[16:22]
-        self.assertEqual(str(a), "{'[10;15)': 1, '[22;25)': 2, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[16:27]
-        self.assertEqual(str(a), "{'[10;15)': 1, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[16:32]
-        self.assertEqual(str(a), "{'[10;15)': 1, '[32;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[16:42]
-        self.assertEqual(str(a), "{'[10;15)': 1}")
-
-        # From 21
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[21:22]
-        self.assertEqual(
-            str(a), "{'[10;15)': 1, '[20;21)': 2, '[22;25)': 2, '[30;35)': 3}"
-        )
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[21:27]
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;21)': 2, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[21:32]
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;21)': 2, '[32;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[21:42]
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;21)': 2}")
-
-        # From 26
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[26:27]
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;25)': 2, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[26:32]
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;25)': 2, '[32;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[26:42]
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;25)': 2}")
-
-        # From 31
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[31:32]
-        self.assertEqual(
-            str(a), "{'[10;15)': 1, '[20;25)': 2, '[30;31)': 3, '[32;35)': 3}"
-        )
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[31:42]
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;25)': 2, '[30;31)': 3}")
-
-        # From 36
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
-        del a[36:42]
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;25)': 2, '[30;35)': 3}")
-
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
+        equal = self.assertEqual
+        a = self._BASE.copy()
         a[12] = 4
         a[14:22] = 5
         del a[12:22]
-        self.assertEqual(str(a), "{'[10;12)': 1, '[22;25)': 2, '[30;35)': 3}")
+        self.assertEqual(
+            a, MutableIntervalDict[int, int]({(10, 12): 1, (22, 25): 2, (30, 35): 3})
+        )
 
         # Test self._stop when interval is empty
-        a = MutableIntervalDict[int, int](
+        copy = MutableIntervalDict[int, int](
             {(10, 15): 1, (20, 25): 2, (30, 35, True, True): 3}
-        )
-        del a[11:35]
-        self.assertEqual(str(a), "{'[10;11)': 1, '[35;35]': 3}")
-        a = MutableIntervalDict[int, int](
-            {(10, 15): 1, (20, 25): 2, (30, 35, True, True): 3}
-        )
-        del a[21:35]
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;21)': 2, '[35;35]': 3}")
-        a = MutableIntervalDict[int, int](
-            {(10, 15): 1, (20, 25): 2, (30, 35, True, True): 3}
-        )
-        del a[31:35]
-        self.assertEqual(
-            str(a), "{'[10;15)': 1, '[20;25)': 2, '[30;31)': 3, '[35;35]': 3}"
-        )
+        ).copy
+        for (lower, upper), expected in STOP_CASES:
+            with self.subTest(lower=lower, upper=upper):
+                a = copy()
+                del a[lower:upper]
+                equal(a, expected)
 
     def test_pop(self):
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
+        a = self._BASE.copy()
         self.assertEqual(a.pop((10, 13)), 1)
-        self.assertEqual(str(a), "{'[13;15)': 1, '[20;25)': 2, '[30;35)': 3}")
+        self.assertEqual(
+            a, MutableIntervalDict[int, int]({(13, 15): 1, (20, 25): 2, (30, 35): 3})
+        )
 
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
+        a = self._BASE.copy()
         self.assertEqual(a.pop((13, 16), 2), 2)
-        self.assertEqual(str(a), "{'[10;15)': 1, '[20;25)': 2, '[30;35)': 3}")
+        self.assertEqual(a, self._BASE)
 
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
+        a = self._BASE.copy()
         with self.assertRaises(KeyError):
             a.pop((13, 16))
 
     def test_popitem(self):
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
+        a = self._BASE.copy()
         self.assertEqual(a.popitem(), (Atomic.from_tuple((10, 15)), 1))
 
     def test_setdefault(self):
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
+        a = self._BASE.copy()
         self.assertEqual(a.setdefault((10, 15), 2), 1)
         self.assertEqual(a.setdefault((13, 17), 2), 2)
         self.assertEqual(
-            str(a), "{'[10;13)': 1, '[13;17)': 2, '[20;25)': 2, '[30;35)': 3}"
+            a,
+            MutableIntervalDict[int, int](
+                {(10, 13): 1, (13, 17): 2, (20, 25): 2, (30, 35): 3}
+            ),
         )
 
     def test_clear(self):
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
+        a = self._BASE.copy()
         a.clear()
-        self.assertEqual(str(a), "{}")
+        self.assertEqual(a, MutableIntervalDict[int, int]())
 
-    def test_default(self):
+    def test_copy(self):
         a = MutableIntervalDict[int, int](
-            {(10, 15): 1, (20, 25): 2, (30, 35): 3}, default=set
-        )
+            {(10, 15): 1}, default=lambda: 0, operator=operator.add
+        )
+        b = a.copy()
+        self.assertEqual(a, b)
+        self.assertIsNot(a._intervals, b._intervals)
+        self.assertEqual(b[(20, 25)], 0)
+        b.update({(10, 15): 1})
+        self.assertEqual(a, MutableIntervalDict[int, int]({(10, 15): 1}))
+        self.assertEqual(b, MutableIntervalDict[int, int]({(10, 15): 2, (20, 25): 0}))
+
+        a = MutableIntervalDict[int, int]({(i, i + 1): i for i in range(0, 6000, 2)})
+        b = a.copy()
+        c = MutableIntervalDict[int, int](a)
+        for i in range(1, 6000, 4):
+            b[(i, i + 1)] = i
+        del c[(2000, 4000)]
+        self.assertEqual(len(a), 3000)
+        self.assertEqual(len(b), 4500)
+        self.assertEqual(len(c), 2000)
+        self.assertEqual(
+            [str(key) for key in list(b.keys())[:3]], ["[0;1)", "[1;2)", "[2;3)"]
+        )
+        self.assertEqual(a, MutableIntervalDict[int, int](a.items()))
+
+    def test_default(self):
+        a = MutableIntervalDict[int, int](self._BASE, default=set)
         self.assertEqual(a[(13, 16)], set())
         self.assertEqual(
-            str(a), "{'[10;13)': 1, '[13;16)': set(), '[20;25)': 2, '[30;35)': 3}"
+            a,
+            MutableIntervalDict[int, int](
+                {(10, 13): 1, (13, 16): set(), (20, 25): 2, (30, 35): 3}
+            ),
         )
 
     def test_compress(self):
-        a = MutableIntervalDict[int, int](default=set)
-        interval = Interval(1, 10)
-        value = 1
-        intervals = FrozenIntervalSet(a.select(interval, strict=False))
-        for other in ((interval & found)[0] for found in intervals):
-            a[other] = a[other].copy()
-            a[other].add(value)
-        for other in FrozenIntervalSet([interval]) - intervals:
-            a[other].add(value)
-        self.assertEqual(str(a), "{'[1;10)': {1}}")
-
-        interval = Interval(5, 20)
-        value = 2
-        intervals = FrozenIntervalSet(a.select(interval, strict=False))
-        for other in ((interval & found)[0] for found in intervals):
-            a[other] = a[other].copy()
-            a[other].add(value)
-        for other in FrozenIntervalSet([interval]) - intervals:
-            a[other].add(value)
-        self.assertEqual(str(a), "{'[1;5)': {1}, '[5;10)': {1, 2}, '[10;20)': {2}}")
-
-        interval = Interval(10, 30)
-        value = 1
-        intervals = FrozenIntervalSet(a.select(interval, strict=False))
-        for other in ((interval & found)[0] for found in intervals):
-            a[other] = a[other].copy()
-            a[other].add(value)
-        for other in FrozenIntervalSet([interval]) - intervals:
-            a[other].add(value)
-        self.assertEqual(
-            str(a),
-            "{'[1;5)': {1}, '[5;10)': {1, 2}, '[10;20)': {1, 2}, '[20;30)': {1}}",
-        )
-        self.assertEqual(
-            str(a.compress()), "{'[1;5)': {1}, '[5;20)': {1, 2}, '[20;30)': {1}}"
+        a = MutableIntervalDict[int, set](default=set, operator=lambda x, y: x | y)
+        a.update({_I110: _V1})
+        self.assertEqual(a, _ONE)
+        a.update({_I520: _V2})
+        self.assertEqual(a, _TWO)
+        a.update({_I1030: _V1})
+        self.assertEqual(a, _THREE)
+        self.assertEqual(a.compress(), _COMPRESSED)
+        intervals = list(a)
+        a.compress_inplace()
+        self.assertEqual(a, _COMPRESSED)
+        self.assertIs(a._intervals[0], intervals[0])
+        self.assertIs(a._intervals[2], intervals[3])
+        self.assertEqual(str(intervals[1]), "[5;10)")
+        self.assertIs(a.compress_inplace(), a)
+        self.assertEqual(a, _COMPRESSED)
+
+        a = MutableIntervalDict[int, int]({(i, i + 1): i - (i == 6) for i in range(20)})
+        expected = a.compress()
+        intervals = list(a)
+        self.assertIs(a.compress_inplace(), a)
+        self.assertEqual(a, expected)
+        self.assertEqual(a[6], 5)
+        self.assertIs(a._intervals[7], intervals[8])
+
+        a = MutableIntervalDict[int, set](default=set)
+        for (interval, value), expected in zip(
+            ((_I110, 1), (_I520, 2), (_I1030, 1)), (_ONE, _TWO, _THREE)
+        ):
+            intervals = FrozenIntervalSet(a.select(interval, strict=False))
+            for other in ((interval & found)[0] for found in intervals):
+                a[other] = a[other].copy()
+                a[other].add(value)
+            for other in FrozenIntervalSet([interval]) - intervals:
+                a[other].add(value)
+            self.assertEqual(a, expected)
+
+        a = MutableIntervalDict[int, set](operator=lambda x, y: x | y)
+        a.update({(None, 33): _V0}, {(None, 28): _V3}, {(30, 40, None, True): _V1})
+        self.assertEqual(
+            a,
+            MutableIntervalDict[int, frozenset](
+                {
+                    (None, 28): frozenset({0, 3}),
+                    (28, 30, True, True): _V0,
+                    (30, 33, None): frozenset({0, 1}),
+                    (33, 40, True, True): _V1,
+                }
+            ),
         )
 
     def test_update(self):
-        a = MutableIntervalDict[int, int]({(10, 15): 1, (20, 25): 2, (30, 35): 3})
+        a = self._BASE.copy()
         a.update([((13, 16), 4), ((40, 45), 5)])
         self.assertEqual(
-            str(a),
-            "{'[10;13)': 1, '[13;16)': 4, '[20;25)': 2, '[30;35)': 3, '[40;45)': 5}",
+            a,
+            MutableIntervalDict[int, int](
+                {(10, 13): 1, (13, 16): 4, (20, 25): 2, (30, 35): 3, (40, 45): 5}
+            ),
         )
 
         a = MutableIntervalDict[int, set](default=set, operator=lambda x, y: x | y)
-        a.update({(1, 10): {1}})
-        self.assertEqual(str(a), "{'[1;10)': {1}}")
-        a.update({(5, 20): {2}})
-        self.assertEqual(str(a), "{'[1;5)': {1}, '[5;10)': {1, 2}, '[10;20)': {2}}")
-        a.update({(10, 30): {1}})
-        self.assertEqual(
-            str(a),
-            "{'[1;5)': {1}, '[5;10)': {1, 2}, '[10;20)': {1, 2}, '[20;30)': {1}}",
-        )
+        a.update({(1, 10): _V1})
+        self.assertEqual(a, _ONE)
+        a.update({(5, 20): _V2})
+        self.assertEqual(a, _TWO)
+        a.update({(10, 30): _V1})
+        self.assertEqual(a, _THREE)
 
         a = MutableIntervalDict[int, set](default=set, operator=lambda x, y: x | y)
-        a.update({(1, 10): {1}})
-        self.assertEqual(str(a), "{'[1;10)': {1}}")
-        a.update({(5, 20): {2}})
-        self.assertEqual(str(a), "{'[1;5)': {1}, '[5;10)': {1, 2}, '[10;20)': {2}}")
+        a.update({(1, 10): _V1})
+        self.assertEqual(a, _ONE)
+        a.update({(5, 20): _V2})
+        self.assertEqual(a, _TWO)
 
         a = MutableIntervalDict[int, set](operator=lambda x, y: x | y, strict=False)
-        a.update({(0, 30): {1}}, {(0, 30): {2}}, {(0, 50): {3}}, {(10, 20): {4}})
+        a.update({(0, 30): _V1}, {(0, 30): _V2}, {(0, 50): _V3}, {(10, 20): _V4})
         self.assertEqual(
-            str(a),
-            "{"
-            "'[0;10)': {1, 2, 3}, "
-            "'[10;20)': {1, 2, 3, 4}, "
-            "'[20;30)': {1, 2, 3}, "
-            "'[30;50)': {3}"
-            "}",
+            a,
+            MutableIntervalDict[int, frozenset](
+                {
+                    (0, 10): frozenset({1, 2, 3}),
+                    (10, 20): frozenset({1, 2, 3, 4}),
+                    (20, 30): frozenset({1, 2, 3}),
+                    (30, 50): _V3,
+                }
+            ),
         )
 
         a = MutableIntervalDict[int, set](operator=lambda x, y: x | y, strict=True)
         a.update(
-            {(0, 30): {1}, (40, 60): {5}},
-            {(0, 30): {2}},
-            {(0, 50): {3}},
-            {(10, 20): {4}, (70, 80): {6}},
-        )
-        self.assertEqual(
-            str(a),
-            "{"
-            "'[0;10)': {1, 2, 3}, "
-            "'[10;20)': {1, 2, 3, 4}, "
-            "'[20;30)': {1, 2, 3}, "
-            "'[30;40)': {3}, "
-            "'[40;50)': {3, 5}, "
-            "'[50;60)': {5}, "
-            "'[70;80)': {6}"
-            "}",
+            {(0, 30): _V1, (40, 60): _V5},
+            {(0, 30): _V2},
+            {(0, 50): _V3},
+            {(10, 20): _V4, (70, 80): _V6},
         )
+        self.assertEqual(a, _SPREAD)
 
         a = MutableIntervalDict[int, set](operator=lambda x, y: x | y, strict=False)
         a.update(
-            {(0, 30): {1}, (40, 60): {5}},
-            {(0, 30): {2}},
-            {(0, 50): {3}},
-            {(10, 20): {4}, (70, 80): {6}},
-        )
-        self.assertEqual(
-            str(a),
-            "{"
-            "'[0;10)': {1, 2, 3}, "
-            "'[10;20)': {1, 2, 3, 4}, "
-            "'[20;30)': {1, 2, 3}, "
-            "'[30;40)': {3}, "
-            "'[40;50)': {3, 5}, "
-            "'[50;60)': {5}, "
-            "'[70;80)': {6}"
-            "}",
+            {(0, 30): _V1, (40, 60): _V5},
+            {(0, 30): _V2},
+            {(0, 50): _V3},
+            {(10, 20): _V4, (70, 80): _V6},
         )
+        self.assertEqual(a, _SPREAD)
 
         a = MutableIntervalDict[int, int](
             operator=operator.add, default=lambda: 0, strict=False
         )
         a.update({(1, 10): 1})
-        self.assertEqual(str(a), "{'[1;10)': 1}")
+        self.assertEqual(a, MutableIntervalDict[int, int]({(1, 10): 1}))
         a.update({(5, 20): 2})
-        self.assertEqual(str(a), "{'[1;5)': 1, '[5;10)': 3, '[10;20)': 2}")
+        self.assertEqual(
+            a, MutableIntervalDict[int, int]({(1, 5): 1, (5, 10): 3, (10, 20): 2})
+        )
         a.update({(10, 30): 3})
+        self.assertEqual(a, _SUMS)
+        self.assertIsInstance(a._intervals, SortedList)
+        a.update({}, [])
+        self.assertEqual(a, _SUMS)
+        a.clear()
+        a.update({})
+        self.assertEqual(a, MutableIntervalDict[int, int]())
+
+        a = MutableIntervalDict[int, int](operator=operator.add)
+        a.update({(10, 20): 1})
+        covered = a._intervals[0]
+        a.update({(5, 25): 1})
         self.assertEqual(
-            str(a), "{'[1;5)': 1, '[5;10)': 3, '[10;20)': 5, '[20;30)': 3}"
+            a, MutableIntervalDict[int, int]({(5, 10): 1, (10, 20): 2, (20, 25): 1})
         )
-        self.assertIsInstance(a._intervals, SortedSet)
+        self.assertIs(a._intervals[1], covered)
 
         with self.assertRaises(TypeError):
             MutableIntervalDict[int, int]().update(None)
 
     def test___or__(self):
-        a = MutableIntervalDict[int, int](
-            {(10, 15): 1, (20, 25): 2, (30, 35): 3}, operator=operator.add
-        )
+        a = MutableIntervalDict[int, int](self._BASE, operator=operator.add)
         self.assertEqual(
-            str(a | MutableIntervalDict[int, int]({(15, 22): 4})),
-            "{'[10;15)': 1, '[15;20)': 4, '[20;22)': 6, '[22;25)': 2, '[30;35)': 3}",
+            a | MutableIntervalDict[int, int]({(15, 22): 4}),
+            MutableIntervalDict[int, int](
+                {(10, 15): 1, (15, 20): 4, (20, 22): 6, (22, 25): 2, (30, 35): 3}
+            ),
         )
         with self.assertRaises(TypeError):
             a | None
 
     def test___ior__(self):
         a = MutableIntervalDict[int, int](operator=lambda x, y: x | y)
-        a |= MutableIntervalDict[int, int]({(1, 10): {1}})
-        self.assertEqual(str(a), "{'[1;10)': {1}}")
-        a |= MutableIntervalDict[int, int]({(5, 20): {2}})
-        self.assertEqual(str(a), "{'[1;5)': {1}, '[5;10)': {1, 2}, '[10;20)': {2}}")
-        a |= MutableIntervalDict[int, int]({(10, 30): {1}})
-        self.assertEqual(
-            str(a),
-            "{'[1;5)': {1}, '[5;10)': {1, 2}, '[10;20)': {1, 2}, '[20;30)': {1}}",
-        )
-        a |= MutableIntervalDict[int, int]({(7, 25): {3}})
-        self.assertEqual(
-            str(a),
-            "{'[1;5)': {1}, '[5;7)': {1, 2}, '[7;10)': {1, 2, 3}, '[10;20)': {1, 2, 3}, '[20;25)': {1, 3}, '[25;30)': {1}}",
+        a |= MutableIntervalDict[int, int]({(1, 10): _V1})
+        self.assertEqual(a, _ONE)
+        a |= MutableIntervalDict[int, int]({(5, 20): _V2})
+        self.assertEqual(a, _TWO)
+        a |= MutableIntervalDict[int, int]({(10, 30): _V1})
+        self.assertEqual(a, _THREE)
+        a |= MutableIntervalDict[int, int]({(7, 25): _V3})
+        self.assertEqual(
+            a,
+            MutableIntervalDict[int, frozenset](
+                {
+                    (1, 5): _V1,
+                    (5, 7): frozenset({1, 2}),
+                    (7, 10): frozenset({1, 2, 3}),
+                    (10, 20): frozenset({1, 2, 3}),
+                    (20, 25): frozenset({1, 3}),
+                    (25, 30): _V1,
+                }
+            ),
         )
         with self.assertRaises(TypeError):
             a |= None
@@ -1,9 +1,9 @@
 import unittest
 
-from part import Empty, Interval, MutableIntervalSet
+from part import Empty, Interval, FrozenIntervalSet, MutableIntervalSet
 
 
-class IntervalTestCase(unittest.TestCase):
+class MutableIntervalSetTestCase(unittest.TestCase):
     def test___contains__(self):
         self.assertIn(
             Interval[int](0, 2),
@@ -24,6 +24,18 @@ class IntervalTestCase(unittest.TestCase):
         self.assertEqual(str(a), "[0;3) | [5;10) | [13;23) | [24;25)")
         a.add(Empty[int]())
         self.assertEqual(str(a), "[0;3) | [5;10) | [13;23) | [24;25)")
+        a.add((6, 8))
+        self.assertEqual(str(a), "[0;3) | [5;10) | [13;23) | [24;25)")
+        a.add((23, 24, None))
+        self.assertEqual(str(a), "[0;3) | [5;10) | [13;23) | (23;25)")
+        a.add((23, 23, True, True))
+        self.assertEqual(str(a), "[0;3) | [5;10) | [13;25)")
+        a.add((11, 12))
+        self.assertEqual(str(a), "[0;3) | [5;10) | [11;12) | [13;25)")
+        a.add((3, 13, None))
+        self.assertEqual(str(a), "[0;3) | (3;25)")
+        a.add((None, 0))
+        self.assertEqual(str(a), "(-inf;3) | (3;25)")
 
     def test_remove(self):
         a = MutableIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
@@ -54,6 +66,18 @@ class IntervalTestCase(unittest.TestCase):
         self.assertEqual(str(a), "[0;1) | [14;15) | [17;20) | (20;23) | [24;25)")
         a.discard(Empty[int]())
         self.assertEqual(str(a), "[0;1) | [14;15) | [17;20) | (20;23) | [24;25)")
+        a.discard((None, 14))
+        self.assertEqual(str(a), "[14;15) | [17;20) | (20;23) | [24;25)")
+        a.discard((21, None, None))
+        self.assertEqual(str(a), "[14;15) | [17;20) | (20;21]")
+
+        a = MutableIntervalSet[int]((i, i + 1) for i in range(0, 6000, 2))
+        a.discard((1000, 5000, None, True))
+        self.assertEqual(len(a), 1001)
+        self.assertEqual(
+            [str(a[index]) for index in range(499, 503)],
+            ["[998;999)", "[1000;1000]", "(5000;5001)", "[5002;5003)"],
+        )
 
     def test___ior__(self):
         a = MutableIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
@@ -62,10 +86,36 @@ class IntervalTestCase(unittest.TestCase):
         with self.assertRaises(TypeError):
             a |= None
 
+        a = MutableIntervalSet[int]()
+        a |= MutableIntervalSet[int]([(5, 10)])
+        self.assertEqual(str(a), "[5;10)")
+        a |= MutableIntervalSet[int]([(11, 12), (13, 14)])
+        self.assertEqual(str(a), "[5;10) | [11;12) | [13;14)")
+        a |= MutableIntervalSet[int]([(0, 1), (2, 3, None)])
+        self.assertEqual(str(a), "[0;1) | (2;3) | [5;10) | [11;12) | [13;14)")
+        a |= MutableIntervalSet[int]([(14, 15)])
+        self.assertEqual(str(a), "[0;1) | (2;3) | [5;10) | [11;12) | [13;15)")
+        a |= MutableIntervalSet[int]([(15, 16, None)])
+        self.assertEqual(str(a), "[0;1) | (2;3) | [5;10) | [11;12) | [13;15) | (15;16)")
+        a |= MutableIntervalSet[int]([(-1, 0)])
+        self.assertEqual(
+            str(a), "[-1;1) | (2;3) | [5;10) | [11;12) | [13;15) | (15;16)"
+        )
+
     def test_update(self):
         a = MutableIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
         a.update([(24, 30), (31, 34)])
         self.assertEqual(str(a), "[0;2) | [5;10) | [13;23) | [24;30) | [31;34)")
+        a.update([(1, 6), (9, 14, True, True)], [(10, 24)], [])
+        self.assertEqual(str(a), "[0;30) | [31;34)")
+        a.update(FrozenIntervalSet[int]([(29, 31, True, True)]))
+        self.assertEqual(str(a), "[0;34)")
+
+        a = MutableIntervalSet[int]((i, i + 2) for i in range(0, 3000, 4))
+        a.update((i + 1, i + 4) for i in range(0, 1500, 4))
+        self.assertEqual(len(a), 375)
+        self.assertEqual(str(a[0]), "[0;1502)")
+        self.assertEqual(str(a[1]), "[1504;1506)")
 
     def test___iand__(self):
         a = MutableIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
@@ -78,6 +128,8 @@ class IntervalTestCase(unittest.TestCase):
         a = MutableIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
         a.intersection_update([(24, 30), (31, 34)])
         self.assertEqual(str(a), "[24;25)")
+        a.intersection_update(FrozenIntervalSet[int]())
+        self.assertEqual(str(a), "")
 
     def test___isub__(self):
         a = MutableIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
@@ -90,6 +142,10 @@ class IntervalTestCase(unittest.TestCase):
         a = MutableIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
         a.difference_update([(24, 30), (31, 34)])
         self.assertEqual(str(a), "[0;2) | [5;10) | [13;23)")
+        a.difference_update(FrozenIntervalSet[int]())
+        self.assertEqual(str(a), "[0;2) | [5;10) | [13;23)")
+        a.difference_update(FrozenIntervalSet[int]([(1, 14)]))
+        self.assertEqual(str(a), "[0;1) | [14;23)")
 
     def test___ixor__(self):
         a = MutableIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
@@ -102,6 +158,8 @@ class IntervalTestCase(unittest.TestCase):
         a = MutableIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])
         a.symmetric_difference_update([(24, 30), (31, 34)])
         self.assertEqual(str(a), "[0;2) | [5;10) | [13;23) | [25;30) | [31;34)")
+        a.symmetric_difference_update(FrozenIntervalSet[int]())
+        self.assertEqual(str(a), "[0;2) | [5;10) | [13;23) | [25;30) | [31;34)")
 
     def test_pop(self):
         a = MutableIntervalSet[int]([(0, 2), (5, 10), (13, 23), (24, 25)])